@@ -1,12 +1,19 @@
-import os
 import json
+import os
+import orjson
 import requests
+from contextvars import ContextVar
 from datetime import datetime
+from typing import Any, Optional
 from core.config import get_config
 from core.shared.output_cleaner import clean_output
 
 TRACE_DIR = "core/research/trace_store"
 
+# Filename of the last trace written by save_trace in the current context, so
+# callers (e.g. the dashboard job runner) can find it without rescanning TRACE_DIR.
+latest_trace: ContextVar[Optional[str]] = ContextVar("latest_trace", default=None)
+
 def run_local_research_ollama(prompt: str):
     config = get_config()
     print("[*] Running local research via Ollama (deepseek-r1)...")
@@ -135,13 +142,38 @@ def run_deep_research(prompt: str):
     return trace["result"]
 
 
+def encode_trace(trace: Any) -> bytes:
+    """
+    Compact trace JSON. orjson rejects ints beyond 64 bits and writes NaN and
+    Infinity as null, so those traces go through json, which keeps both.
+    """
+    try:
+        data = orjson.dumps(trace)
+    except TypeError:
+        data = None
+    # Any null may be a non-finite float orjson dropped; let json write it
+    if data is None or b"null" in data:
+        return json.dumps(trace, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return data
+
+
+def decode_trace(raw: bytes) -> Any:
+    """Parse trace bytes; json handles what orjson rejects (NaN, Infinity, a BOM)."""
+    try:
+        return orjson.loads(raw)
+    except orjson.JSONDecodeError:
+        return json.loads(raw)
+
+
 def save_trace(trace: dict):
     os.makedirs(TRACE_DIR, exist_ok=True)
     timestamp = trace.get("timestamp", datetime.utcnow().isoformat())
     filename = f"replay_{timestamp.replace(':', '-')}.json"
     filepath = os.path.join(TRACE_DIR, filename)
 
-    with open(filepath, "w") as f:
-        json.dump(trace, f, indent=2)
+    # Compact JSON; the dashboard trace page pretty-prints it for display
+    with open(filepath, "wb") as f:
+        f.write(encode_trace(trace))
 
+    latest_trace.set(filename)
     print(f"[+] Trace saved to {filepath}")
@@ -315,12 +315,24 @@ def run_probe_suite_to_dict(
     hypothesis: str,
     protocol: str,
     probe_count: int = 3,
-    include_control: bool = True
+    include_control: bool = True,
+    capture_output: bool = False
 ) -> Dict[str, Any]:
     """
     Run probe suite and return JSON-serializable dictionary.
 
-    This is the main entry point for the dashboard API.
+    This is the main entry point for the dashboard API. With capture_output,
+    everything the suite prints is returned under "console_output" instead of
+    going to stdout; this swaps the process-wide stdout, so only use it where
+    nothing else prints concurrently (e.g. a dedicated worker process).
     """
-    results = run_probe_suite(hypothesis, protocol, probe_count, include_control)
-    return experiment_results_to_dict(results)
+    if not capture_output:
+        results = run_probe_suite(hypothesis, protocol, probe_count, include_control)
+        return experiment_results_to_dict(results)
+
+    output_buffer = io.StringIO()
+    with contextlib.redirect_stdout(output_buffer):
+        results = run_probe_suite(hypothesis, protocol, probe_count, include_control)
+    experiment_results = experiment_results_to_dict(results)
+    experiment_results["console_output"] = output_buffer.getvalue()
+    return experiment_results
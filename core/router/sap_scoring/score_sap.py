@@ -1,232 +1,215 @@
 # 7-Degree SAP Scoring System (Deterministic Heuristics)
 
 import re
-from typing import Dict, Any
+from typing import Dict, Any, List, Tuple
 from functools import lru_cache
 
 
 from core.config import get_config
 
-# Precompile all regex patterns for performance (avoid recompilation on every scoring call)
-# Plausibility patterns
-PLAUSIBILITY_CONCRETE = [re.compile(rf'\b{word}\b') for word in
-                         ['implement', 'deploy', 'configure', 'test', 'analyze', 'optimize', 'monitor']]
-PLAUSIBILITY_TECHNICAL = re.compile(r'\b(algorithm|protocol|system|framework|model|api)\b')
-PLAUSIBILITY_VAGUE = [re.compile(rf'\b{word}\b') for word in
-                      ['maybe', 'perhaps', 'possibly', 'might', 'could potentially']]
-
-# Utility patterns
-UTILITY_BENEFIT = [re.compile(rf'\b{word}\b') for word in
-                   ['improve', 'enhance', 'reduce', 'increase', 'solve', 'fix', 'optimize']]
-UTILITY_MEASURABLE = re.compile(r'\b(performance|efficiency|accuracy|speed|cost)\b')
-UTILITY_IMPACT = re.compile(r'\b(user|system|process|workflow)\b')
-
-# Novelty patterns
-NOVELTY_INNOVATIVE = [re.compile(rf'\b{word}\b') for word in
-                      ['innovative', 'novel', 'creative', 'experimental', 'new', 'alternative']]
-NOVELTY_ADVANCED = re.compile(r'\b(latent|neural|genetic|advanced|sophisticated)\b')
-NOVELTY_CONSERVATIVE = [re.compile(rf'\b{word}\b') for word in
-                        ['standard', 'traditional', 'conventional', 'typical', 'routine']]
-
-# Risk patterns
-RISK_HIGH = [re.compile(rf'\b{word}\b') for word in
-             ['experimental', 'unproven', 'untested', 'aggressive', 'radical']]
-RISK_BREAKING = re.compile(r'\b(breaking|destructive|irreversible|critical)\b')
-RISK_SAFE = [re.compile(rf'\b{word}\b') for word in
-             ['validated', 'tested', 'proven', 'stable', 'safe', 'controlled']]
-
-# Alignment patterns
-ALIGNMENT_POSITIVE = [re.compile(rf'\b{word}\b') for word in
-                      ['safe', 'secure', 'privacy', 'ethical', 'compliant', 'validated']]
-ALIGNMENT_AWARENESS = re.compile(r'\b(monitor|audit|review|verify|check)\b')
-ALIGNMENT_PENALTY = [re.compile(rf'\b{word}\b') for word in
-                     ['bypass', 'override', 'skip', 'ignore']]
-
-# Efficiency patterns
-EFFICIENCY_WORDS = [re.compile(rf'\b{word}\b') for word in
-                    ['optimize', 'efficient', 'fast', 'lightweight', 'streamline', 'reduce']]
-EFFICIENCY_PERFORMANCE = re.compile(r'\b(performance|speed|throughput|latency)\b')
-EFFICIENCY_NEGATIVE = re.compile(r'\b(complex|complicated|overhead|redundant|bloat)\b')
-
-# Resilience patterns
-RESILIENCE_WORDS = [re.compile(rf'\b{word}\b') for word in
-                    ['robust', 'reliable', 'fault-tolerant', 'recovery', 'backup', 'fallback']]
-RESILIENCE_BONUS = [re.compile(rf'\b{word}\b') for word in
-                    ['validate', 'test', 'rollback', 'monitor']]
-RESILIENCE_ERROR = re.compile(r'\b(error|exception|handling|validation|check)\b')
-RESILIENCE_FRAGILE = re.compile(r'\b(brittle|fragile|unstable|unreliable)\b')
-
-# Cache scoring calculations (128 most recent unique SAP texts)
-@lru_cache(maxsize=128)
-def _calculate_plausibility(text_lower: str) -> int:
+# Keyword sets, matched against the word tokens of a SAP (tokenized once per
+# call); a set hit is the same test as the old \bword\b regex search
+_TOKEN = re.compile(r'\w+')
+
+
+def _phrases(*literals: str) -> Tuple[Tuple[str, "re.Pattern[str]"], ...]:
+    """(literal, \\bliteral\\b regex) pairs for keywords spanning several tokens."""
+    return tuple((literal, re.compile(rf'\b{re.escape(literal)}\b')) for literal in literals)
+
+
+# Plausibility keywords
+PLAUSIBILITY_CONCRETE = frozenset(['implement', 'deploy', 'configure', 'test', 'analyze', 'optimize', 'monitor'])
+PLAUSIBILITY_TECHNICAL = frozenset(['algorithm', 'protocol', 'system', 'framework', 'model', 'api'])
+PLAUSIBILITY_VAGUE = frozenset(['maybe', 'perhaps', 'possibly', 'might'])
+# Multi-word keywords span several tokens, so they keep a regex; the regex
+# only runs once a plain substring test (a C fast search) has found the literal
+PLAUSIBILITY_VAGUE_PHRASES = _phrases('could potentially')
+
+# Utility keywords
+UTILITY_BENEFIT = frozenset(['improve', 'enhance', 'reduce', 'increase', 'solve', 'fix', 'optimize'])
+UTILITY_MEASURABLE = frozenset(['performance', 'efficiency', 'accuracy', 'speed', 'cost'])
+UTILITY_IMPACT = frozenset(['user', 'system', 'process', 'workflow'])
+
+# Novelty keywords
+NOVELTY_INNOVATIVE = frozenset(['innovative', 'novel', 'creative', 'experimental', 'new', 'alternative'])
+NOVELTY_ADVANCED = frozenset(['latent', 'neural', 'genetic', 'advanced', 'sophisticated'])
+NOVELTY_CONSERVATIVE = frozenset(['standard', 'traditional', 'conventional', 'typical', 'routine'])
+
+# Risk keywords
+RISK_HIGH = frozenset(['experimental', 'unproven', 'untested', 'aggressive', 'radical'])
+RISK_BREAKING = frozenset(['breaking', 'destructive', 'irreversible', 'critical'])
+RISK_SAFE = frozenset(['validated', 'tested', 'proven', 'stable', 'safe', 'controlled'])
+
+# Alignment keywords
+ALIGNMENT_POSITIVE = frozenset(['safe', 'secure', 'privacy', 'ethical', 'compliant', 'validated'])
+ALIGNMENT_AWARENESS = frozenset(['monitor', 'audit', 'review', 'verify', 'check'])
+ALIGNMENT_PENALTY = frozenset(['bypass', 'override', 'skip', 'ignore'])
+
+# Efficiency keywords
+EFFICIENCY_WORDS = frozenset(['optimize', 'efficient', 'fast', 'lightweight', 'streamline', 'reduce'])
+EFFICIENCY_PERFORMANCE = frozenset(['performance', 'speed', 'throughput', 'latency'])
+EFFICIENCY_NEGATIVE = frozenset(['complex', 'complicated', 'overhead', 'redundant', 'bloat'])
+
+# Resilience keywords
+RESILIENCE_WORDS = frozenset(['robust', 'reliable', 'recovery', 'backup', 'fallback'])
+RESILIENCE_WORDS_PHRASES = _phrases('fault-tolerant')
+RESILIENCE_BONUS = frozenset(['validate', 'test', 'rollback', 'monitor'])
+RESILIENCE_ERROR = frozenset(['error', 'exception', 'handling', 'validation', 'check'])
+RESILIENCE_FRAGILE = frozenset(['brittle', 'fragile', 'unstable', 'unreliable'])
+
+
+# Byte table for ASCII text: word characters ([A-Za-z0-9_], which is what \w
+# matches below 128) map to themselves, everything else to a space
+_ASCII_WORDS = bytes(
+    c if chr(c).isascii() and (chr(c).isalnum() or chr(c) == '_') else 0x20
+    for c in range(256)
+)
+
+
+def _tokenize(text_lower: str) -> frozenset:
+    """Distinct word tokens of already-lowercased text."""
+    if text_lower.isascii():
+        # One C translate pass plus split: ~3x cheaper than the regex
+        return frozenset(text_lower.encode('ascii').translate(_ASCII_WORDS).decode('ascii').split())
+    return frozenset(_TOKEN.findall(text_lower))
+
+
+# Order of the degrees in _score_cached tuples and score_sap dicts
+DEGREE_NAMES = ("plausibility", "utility", "novelty", "risk", "alignment", "efficiency", "resilience")
+
+
+# The scoring heuristics, the single definition used by _raw_degrees and
+# score_saps. Every dimension starts at 5 and is clipped to 0-10; per
+# dimension, (keywords, points, once) where once=True scores the group a
+# single time on any hit and once=False scores every distinct keyword hit;
+# then (phrases, points)
+_DIMENSION_RULES = {
+    # Concrete, actionable language and technical specificity; vague hedging
+    "plausibility": (
+        ((PLAUSIBILITY_CONCRETE, 2, False), (PLAUSIBILITY_TECHNICAL, 2, True), (PLAUSIBILITY_VAGUE, -1, False)),
+        ((PLAUSIBILITY_VAGUE_PHRASES, -1),),
+    ),
+    # Problem-solving benefits, measurable outcomes, user/system impact
+    "utility": (
+        ((UTILITY_BENEFIT, 1, False), (UTILITY_MEASURABLE, 2, True), (UTILITY_IMPACT, 1, True)),
+        (),
+    ),
+    # Creative or advanced approaches; conventional ones reduce novelty
+    "novelty": (
+        ((NOVELTY_INNOVATIVE, 2, False), (NOVELTY_ADVANCED, 2, True), (NOVELTY_CONSERVATIVE, -1, False)),
+        (),
+    ),
+    # Higher = more risky (inverted in _score_cached)
+    "risk": (
+        ((RISK_HIGH, 2, False), (RISK_BREAKING, 2, True), (RISK_SAFE, -1, False)),
+        (),
+    ),
+    # Safety/ethics and risk awareness; bypassing controls is a heavy penalty
+    "alignment": (
+        ((ALIGNMENT_POSITIVE, 2, False), (ALIGNMENT_AWARENESS, 1, True), (ALIGNMENT_PENALTY, -3, False)),
+        (),
+    ),
+    # Resource optimization and performance focus; complexity and overhead
+    "efficiency": (
+        ((EFFICIENCY_WORDS, 1, False), (EFFICIENCY_PERFORMANCE, 2, True), (EFFICIENCY_NEGATIVE, -1, True)),
+        (),
+    ),
+    # Robustness and error handling; fragility
+    "resilience": (
+        ((RESILIENCE_WORDS, 2, False), (RESILIENCE_BONUS, 1, False),
+         (RESILIENCE_ERROR, 1, True), (RESILIENCE_FRAGILE, -2, True)),
+        ((RESILIENCE_WORDS_PHRASES, 2),),
+    ),
+}
+
+
+def _compile_raw_degrees():
     """
-    Score plausibility based on concrete, actionable language.
-    Higher scores for specific technical terms and clear actions.
-    """
-    score = 5  # baseline
-
-    # Positive indicators
-    for pattern in PLAUSIBILITY_CONCRETE:
-        if pattern.search(text_lower):
-            score += 2
-
-    # Technical specificity
-    if PLAUSIBILITY_TECHNICAL.search(text_lower):
-        score += 2
-
-    # Negative indicators
-    for pattern in PLAUSIBILITY_VAGUE:
-        if pattern.search(text_lower):
-            score -= 1
-
-    return max(0, min(10, score))
-
-
-@lru_cache(maxsize=128)
-def _calculate_utility(text_lower: str) -> int:
-    """
-    Score utility based on problem-solving and outcome focus.
-    """
-    score = 5  # baseline
-
-    # Benefit indicators
-    for pattern in UTILITY_BENEFIT:
-        if pattern.search(text_lower):
-            score += 1
-
-    # Measurable outcomes
-    if UTILITY_MEASURABLE.search(text_lower):
-        score += 2
-
-    # User/system impact
-    if UTILITY_IMPACT.search(text_lower):
-        score += 1
-
-    return max(0, min(10, score))
-
-
-@lru_cache(maxsize=128)
-def _calculate_novelty(text_lower: str) -> int:
-    """
-    Score novelty based on creative/unconventional approaches.
-    """
-    score = 5  # baseline
-
-    # Innovation indicators
-    for pattern in NOVELTY_INNOVATIVE:
-        if pattern.search(text_lower):
-            score += 2
-
-    # Advanced/cutting-edge terms
-    if NOVELTY_ADVANCED.search(text_lower):
-        score += 2
-
-    # Conservative indicators (reduce novelty)
-    for pattern in NOVELTY_CONSERVATIVE:
-        if pattern.search(text_lower):
-            score -= 1
-
-    return max(0, min(10, score))
-
-
-@lru_cache(maxsize=128)
-def _calculate_risk(text_lower: str) -> int:
-    """
-    Score risk level (higher = more risky).
-    Will be inverted in final scoring.
-    """
-    score = 5  # baseline
-
-    # High risk indicators
-    for pattern in RISK_HIGH:
-        if pattern.search(text_lower):
-            score += 2
-
-    # Breaking changes
-    if RISK_BREAKING.search(text_lower):
-        score += 2
-
-    # Safety indicators (reduce risk)
-    for pattern in RISK_SAFE:
-        if pattern.search(text_lower):
-            score -= 1
-
-    return max(0, min(10, score))
-
-
-@lru_cache(maxsize=128)
-def _calculate_alignment(text_lower: str) -> int:
-    """
-    Score alignment with safety and ethical considerations.
-    """
-    score = 5  # baseline
-
-    # Positive alignment indicators
-    for pattern in ALIGNMENT_POSITIVE:
-        if pattern.search(text_lower):
-            score += 2
-
-    # Risk awareness
-    if ALIGNMENT_AWARENESS.search(text_lower):
-        score += 1
-
-    # Negative alignment indicators (Alignment penalty)
-    for pattern in ALIGNMENT_PENALTY:
-        if pattern.search(text_lower):
-            score -= 3  # Significant penalty
-
-    return max(0, min(10, score))
-
-
-@lru_cache(maxsize=128)
-def _calculate_efficiency(text_lower: str) -> int:
-    """
-    Score efficiency based on resource optimization.
-    """
-    score = 5  # baseline
-
-    # Efficiency indicators
-    for pattern in EFFICIENCY_WORDS:
-        if pattern.search(text_lower):
-            score += 1
-
-    # Performance focus
-    if EFFICIENCY_PERFORMANCE.search(text_lower):
-        score += 2
-
-    # Inefficiency indicators
-    if EFFICIENCY_NEGATIVE.search(text_lower):
-        score -= 1
-
-    return max(0, min(10, score))
+    Generate one function scoring all seven dimensions from _DIMENSION_RULES.
 
-
-@lru_cache(maxsize=128)
-def _calculate_resilience(text_lower: str) -> int:
-    """
-    Score resilience based on robustness and error handling.
+    Every keyword test is unrolled into its own `'word' in tokens` check, so a
+    call is straight-line bytecode with no loops or temporary sets. Returns
+    the clipped scores in DEGREE_NAMES order (risk not yet inverted, no
+    length penalty).
     """
-    score = 5  # baseline
+    namespace: Dict[str, Any] = {}
+    lines = ["def _raw_degrees(tokens, text_lower):"]
+    for d, name in enumerate(DEGREE_NAMES):
+        keyword_rules, phrase_rules = _DIMENSION_RULES[name]
+        lines.append(f"    s{d} = 5")
+        for keywords, points, once in keyword_rules:
+            tests = [f"{word!r} in tokens" for word in sorted(keywords)]
+            if once:
+                lines.append(f"    if {' or '.join(tests)}: s{d} += {points}")
+            else:
+                lines.extend(f"    if {test}: s{d} += {points}" for test in tests)
+        for phrases, points in phrase_rules:
+            for literal, pattern in phrases:
+                ref = f"_phrase{len(namespace)}"
+                namespace[ref] = pattern
+                lines.append(f"    if {literal!r} in text_lower and {ref}.search(text_lower): s{d} += {points}")
+    lines.append("    return (" + ", ".join(f"max(0, min(10, s{d}))" for d in range(len(DEGREE_NAMES))) + ")")
+    exec("\n".join(lines), namespace)
+    return namespace["_raw_degrees"]
+
+
+_raw_degrees = _compile_raw_degrees()
+
+
+def _single_degree(index: int):
+    """Single-text entry point for one dimension, tokenizing its argument on each call."""
+    def calculate(text_lower: str) -> int:
+        return _raw_degrees(_tokenize(text_lower), text_lower)[index]
+    calculate.__name__ = f"_calculate_{DEGREE_NAMES[index]}"
+    return calculate
+
+
+(
+    _calculate_plausibility,
+    _calculate_utility,
+    _calculate_novelty,
+    _calculate_risk,
+    _calculate_alignment,
+    _calculate_efficiency,
+    _calculate_resilience,
+) = (_single_degree(d) for d in range(len(DEGREE_NAMES)))
+
+
+# Degrees depend only on the text; weights are applied per call so a config
+# reload still takes effect on cached SAPs
+@lru_cache(maxsize=4096)
+def _score_cached(title: str, description: str) -> Tuple[int, ...]:
+    """The seven degrees of a SAP, in DEGREE_NAMES order."""
+    full_text = title + " - " + description
+    full_text_lower = full_text.lower()
 
-    # Resilience indicators
-    for pattern in RESILIENCE_WORDS:
-        if pattern.search(text_lower):
-            score += 2
+    # Calculate every dimension in one generated pass over a single tokenization
+    plausibility, utility, novelty, risk_raw, alignment, efficiency, resilience = _raw_degrees(
+        _tokenize(full_text_lower), full_text_lower
+    )
 
-    # Resilience bonus
-    for pattern in RESILIENCE_BONUS:
-        if pattern.search(text_lower):
-            score += 1
+    # Length penalty application
+    length_penalty = 0
+    if len(full_text) > 1000:
+        length_penalty = 2
+    elif len(full_text) > 500:
+        length_penalty = 1
 
-    # Error handling
-    if RESILIENCE_ERROR.search(text_lower):
-        score += 1
+    return (
+        plausibility,
+        utility,
+        novelty,
+        10 - risk_raw,  # Invert: lower risk = higher score
+        alignment,
+        # Apply length penalty to efficiency
+        max(0, efficiency - length_penalty),
+        resilience,
+    )
 
-    # Fragility indicators
-    if RESILIENCE_FRAGILE.search(text_lower):
-        score -= 2
 
-    return max(0, min(10, score))
+def _composite(degree_values: Tuple[int, ...], weights: Dict[str, float]) -> float:
+    """Weighted sum of a degrees tuple (in DEGREE_NAMES order)."""
+    return sum(value * weights.get(name, 1.0) for name, value in zip(DEGREE_NAMES, degree_values))
 
 
 def score_sap(sap: Dict[str, str]) -> Dict[str, Any]:
@@ -249,42 +232,127 @@ def score_sap(sap: Dict[str, str]) -> Dict[str, Any]:
         - resilience: Robustness and error handling
     """
     config = get_config()
-    full_text = sap['title'] + " - " + sap['description']
-    full_text_lower = full_text.lower()
 
     print(f"Scoring SAP: {sap['title']}")
 
-    # Calculate each dimension using heuristics
-    risk_raw = _calculate_risk(full_text_lower)
-
-    degrees = {
-        "plausibility": _calculate_plausibility(full_text_lower),
-        "utility": _calculate_utility(full_text_lower),
-        "novelty": _calculate_novelty(full_text_lower),
-        "risk": 10 - risk_raw,  # Invert: lower risk = higher score
-        "alignment": _calculate_alignment(full_text_lower),
-        "efficiency": _calculate_efficiency(full_text_lower),
-        "resilience": _calculate_resilience(full_text_lower),
-    }
-
-    # Length penalty application
-    length_penalty = 0
-    if len(full_text) > 1000:
-        length_penalty = 2
-    elif len(full_text) > 500:
-        length_penalty = 1
-
-    # Apply length penalty to efficiency
-    degrees["efficiency"] = max(0, degrees["efficiency"] - length_penalty)
+    degree_values = _score_cached(sap['title'], sap['description'])
 
     # Weighted composite score
-    weights = config.sap_scoring_weights
-    weighted_score = sum(degrees[key] * weights.get(key, 1.0) for key in degrees)
-
-    composite_score = weighted_score
+    composite_score = _composite(degree_values, config.sap_scoring_weights)
 
     return {
         **sap,  # Include title + description
-        "degrees": degrees,
+        "degrees": dict(zip(DEGREE_NAMES, degree_values)),
         "composite_score": round(composite_score, 2)
-    }
\ No newline at end of file
+    }
+
+
+_VOCABULARY = sorted(set().union(*(
+    keywords for rules, _ in _DIMENSION_RULES.values() for keywords, _, _ in rules
+)))
+_VOCABULARY_SET = frozenset(_VOCABULARY)
+_TOKEN_IDS = {word: i for i, word in enumerate(_VOCABULARY)}
+# (dimension, literal, pattern, points) for each phrase keyword
+_PHRASE_RULES = [
+    (d, literal, pattern, points)
+    for d, name in enumerate(DEGREE_NAMES)
+    for phrases, points in _DIMENSION_RULES[name][1]
+    for literal, pattern in phrases
+]
+
+
+@lru_cache(maxsize=1)
+def _rule_matrices():
+    """(per-keyword points, once-group masks, once-group points) as arrays."""
+    import numpy as np
+
+    vocab_size, dims = len(_VOCABULARY), len(DEGREE_NAMES)
+    keyword_points = np.zeros((vocab_size, dims), dtype=np.int32)
+    group_masks = []
+    group_points = []
+    for d, name in enumerate(DEGREE_NAMES):
+        for keywords, points, once in _DIMENSION_RULES[name][0]:
+            ids = [_TOKEN_IDS[word] for word in keywords]
+            if once:
+                mask = np.zeros(vocab_size, dtype=np.int32)
+                mask[ids] = 1
+                group_masks.append(mask)
+                row = np.zeros(dims, dtype=np.int32)
+                row[d] = points
+                group_points.append(row)
+            else:
+                keyword_points[ids, d] += points
+    return keyword_points, np.stack(group_masks, axis=1), np.stack(group_points)
+
+
+def score_saps(saps: List[Dict[str, str]]) -> List[Dict[str, Any]]:
+    """
+    Score a batch of SAPs; same results as [score_sap(sap) for sap in saps].
+
+    Each SAP is tokenized once into a row of a (SAPs x keywords) presence
+    matrix, and all seven degrees for the whole batch come out of a few matrix
+    products. Worth it for candidate pools; a handful of SAPs is cheaper
+    through score_sap.
+
+    Args:
+        saps (list): [{ title: str, description: str }, ...]
+
+    Returns:
+        list: scored SAP dicts in input order
+    """
+    import numpy as np
+
+    if not saps:
+        return []
+    config = get_config()
+    keyword_points, group_masks, group_points = _rule_matrices()
+
+    # (row, keyword id) pairs of the presence matrix, built up CSR-style
+    rows: List[int] = []
+    cols: List[int] = []
+    texts = []
+    for row, sap in enumerate(saps):
+        print(f"Scoring SAP: {sap['title']}")
+        text = (sap['title'] + " - " + sap['description']).lower()
+        texts.append(text)
+        ids = [_TOKEN_IDS[word] for word in _VOCABULARY_SET.intersection(_tokenize(text))]
+        rows.extend([row] * len(ids))
+        cols.extend(ids)
+    presence = np.zeros((len(saps), len(_VOCABULARY)), dtype=np.int32)
+    presence[rows, cols] = 1
+
+    # Phrases: one regex pass over the newline-joined batch per pattern, hits
+    # mapped back to rows by offset (a phrase never spans the separator)
+    adjust = np.full((len(saps), len(DEGREE_NAMES)), 5, dtype=np.int32)  # baseline
+    batch = "\n".join(texts)
+    starts = np.cumsum([0] + [len(text) + 1 for text in texts[:-1]])
+    for d, literal, pattern, points in _PHRASE_RULES:
+        if literal not in batch:
+            continue
+        offsets = [match.start() for match in pattern.finditer(batch)]
+        if offsets:
+            hit_rows = np.unique(np.searchsorted(starts, offsets, side="right") - 1)
+            adjust[hit_rows, d] += points
+
+    raw = adjust + presence @ keyword_points + ((presence @ group_masks) > 0).astype(np.int32) @ group_points
+    degrees = np.clip(raw, 0, 10)
+
+    risk = DEGREE_NAMES.index("risk")
+    degrees[:, risk] = 10 - degrees[:, risk]  # Invert: lower risk = higher score
+
+    # Length penalty on efficiency; lengths are of the untouched text
+    lengths = np.fromiter((len(sap['title']) + 3 + len(sap['description']) for sap in saps),
+                          dtype=np.int64, count=len(saps))
+    penalty = (lengths > 500).astype(np.int32) + (lengths > 1000)
+    efficiency = DEGREE_NAMES.index("efficiency")
+    degrees[:, efficiency] = np.maximum(0, degrees[:, efficiency] - penalty)
+
+    weights = config.sap_scoring_weights
+    results = []
+    for sap, row in zip(saps, degrees.tolist()):
+        results.append({
+            **sap,
+            "degrees": dict(zip(DEGREE_NAMES, row)),
+            "composite_score": round(_composite(row, weights), 2)
+        })
+    return results
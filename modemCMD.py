@@ -1,5 +1,6 @@
 #!/usr/bin/env python3
 
+import importlib.util
 import sys
 import subprocess
 
@@ -13,9 +14,20 @@ Commands:
   modemctl simulate          Run a flare trial through the latent executor
 """)
 
+def _server_flags():
+    # Pin the C event loop and HTTP parser when installed (uvloop has no Windows
+    # build) and skip the per-request access log line. One process only: jobs
+    # and their SSE waiters live in the dashboard's memory.
+    flags = ["--no-access-log"]
+    if importlib.util.find_spec("uvloop") is not None:
+        flags += ["--loop", "uvloop"]
+    if importlib.util.find_spec("httptools") is not None:
+        flags += ["--http", "httptools"]
+    return flags
+
 def run_dashboard():
     print("[MAPLE] Launching dashboard at http://localhost:8347 ...")
-    subprocess.run(["uvicorn", "modem_api.ui.dashboard:app", "--port", "8347", "--reload"])
+    subprocess.run(["uvicorn", "modem_api.ui.dashboard:app", "--port", "8347", "--reload", *_server_flags()])
 
 def run_replay(scroll_file):
     subprocess.run(["python3", "modem_api/core/replay_engine.py", scroll_file])
@@ -1,32 +1,91 @@
 from __future__ import annotations
 
-import html
+import asyncio
+import contextlib
+import gzip
+import hashlib
+import heapq
+import importlib
+import io
 import json
+import multiprocessing
 import os
+import orjson
+import re
+import sys
+import threading
 import time
-import uuid
-import io
-import contextlib
-import datetime
 import requests
-from dataclasses import dataclass, asdict
-from typing import Any, Dict, Optional, List
-from concurrent.futures import ThreadPoolExecutor
-
-from fastapi import FastAPI, HTTPException
-from fastapi.responses import HTMLResponse, JSONResponse
+from collections import OrderedDict
+from dataclasses import dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, AsyncIterator, Dict, Iterator, Literal, Optional, List, Tuple, get_args
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+
+from fastapi import FastAPI, HTTPException, Request
+from fastapi.responses import FileResponse, HTMLResponse, ORJSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, StrictInt, ValidationError
+from starlette.concurrency import run_in_threadpool
 
 from core.task_manager.runner import new_task
 from core.router.latent_mode.latent_executor import latent_execute, run_probe_suite_to_dict
+from core.research.research_session import decode_trace, encode_trace, latest_trace
 from core.shared.quality_score import quality_score
 
 # ---- Config ----
 TRACE_DIR = os.path.join("core", "research", "trace_store")
 MAX_RECENT_TRACES = 25
 MAX_PROMPT_LENGTH = 50000
-EXECUTOR = ThreadPoolExecutor(max_workers=1)  # keep simple: 1 job at a time
-
-app = FastAPI()
+MAX_JOBS = 500  # oldest jobs are evicted beyond this
+JOB_TTL = 3600.0  # finished jobs are reaped this many seconds after finishing
+JOB_REAP_INTERVAL = 60.0
+# Queued jobs run one at a time: task/simulation runners on an EXECUTOR
+# thread (stdout captured per thread), experiment suites in the _CPU_POOL
+# worker process, which is sized to match
+JOB_WORKERS = 1
+EXECUTOR = ThreadPoolExecutor(max_workers=JOB_WORKERS)
+_SUMMARY_POOL = ThreadPoolExecutor(max_workers=8)  # trace summary reads for listings
+# Experiment probe suites (classification, stdout capture) run in a child
+# process so they don't hold the GIL against request handling
+_CPU_POOL: Optional[ProcessPoolExecutor] = None
+_CPU_POOL_CLOSED = False  # set by _lifespan on shutdown; no new pool after that
+_CPU_POOL_LOCK = threading.Lock()
+
+@contextlib.asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    """Start the job workers, job reaper and trace watcher; stop them all on shutdown."""
+    global JOB_QUEUE, _TRACE_WATCHER, _TRACE_WATCH_STOP, _CPU_POOL, _CPU_POOL_CLOSED
+    with _CPU_POOL_LOCK:
+        _CPU_POOL_CLOSED = False
+    # Created here so the queue belongs to the server's event loop
+    JOB_QUEUE = asyncio.Queue()
+    _JOB_TASKS.extend(asyncio.create_task(_job_worker(JOB_QUEUE)) for _ in range(JOB_WORKERS))
+    _JOB_TASKS.append(asyncio.create_task(_job_reaper()))
+    _TRACE_WATCH_STOP = asyncio.Event()
+    _TRACE_WATCHER = asyncio.create_task(_watch_trace_dir(_TRACE_WATCH_STOP))
+    # Job logs are captured per thread while the server runs; sys.stdout is
+    # restored once the workers have stopped
+    with _thread_stdout():
+        try:
+            yield
+        finally:
+            # Let awatch return on its own rather than abandoning it mid-watch
+            _TRACE_WATCH_STOP.set()
+            for task in _JOB_TASKS:
+                task.cancel()
+            await asyncio.gather(_TRACE_WATCHER, *_JOB_TASKS, return_exceptions=True)
+            _JOB_TASKS.clear()
+            with _CPU_POOL_LOCK:
+                _CPU_POOL_CLOSED = True
+                if _CPU_POOL is not None:
+                    _CPU_POOL.shutdown(wait=False, cancel_futures=True)
+                    _CPU_POOL = None
+
+# Routes return ORJSONResponse themselves: a plain dict would still go through
+# jsonable_encoder before reaching the response class
+app = FastAPI(default_response_class=ORJSONResponse, lifespan=_lifespan)
 
 def _check_system_health() -> Dict[str, Any]:
     # Scroll Engine
@@ -52,9 +111,7 @@ def _check_system_health() -> Dict[str, Any]:
         ollama_health = "unreachable"
 
     # Trace Store
-    trace_count = 0
-    if os.path.exists(TRACE_DIR):
-        trace_count = len([f for f in os.listdir(TRACE_DIR) if f.endswith(".json")])
+    trace_count = _trace_count()
 
     return {
         "scroll_engine": scroll_health,
@@ -76,19 +133,101 @@ def _run_research(prompt: str) -> str:
     except Exception as e:
         raise RuntimeError("Could not import research runner.") from e
 
+# ---- Job output capture ----
+class _ThreadStdout:
+    """
+    sys.stdout stand-in: writes from a thread inside _captured_stdout() go to
+    that thread's buffer, everything else to the real stream. Unlike
+    redirect_stdout, other threads' output is never swallowed into a job log.
+    """
+
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+
+    def _target(self):
+        return getattr(self._local, "buffer", None) or self.stream
+
+    def write(self, s: str) -> int:
+        return self._target().write(s)
+
+    def flush(self) -> None:
+        self._target().flush()
+
+    def __getattr__(self, name: str):
+        return getattr(self.stream, name)  # encoding, fileno, isatty, ...
+
+_STDOUT_LOCK = threading.Lock()
+
+@contextlib.contextmanager
+def _thread_stdout() -> Iterator[None]:
+    """Route sys.stdout through a _ThreadStdout proxy, restoring it on exit."""
+    with _STDOUT_LOCK:
+        proxy = sys.stdout = _ThreadStdout(sys.stdout)
+    try:
+        yield
+    finally:
+        with _STDOUT_LOCK:
+            if sys.stdout is proxy:  # leave a later replacement alone
+                sys.stdout = proxy.stream
+
+@contextlib.contextmanager
+def _captured_stdout() -> Iterator[io.StringIO]:
+    """Collect what the current thread prints, e.g. a job's log for the UI."""
+    proxy = sys.stdout
+    if not isinstance(proxy, _ThreadStdout):
+        # No server running (_lifespan installs the proxy), so no other
+        # thread's output can be swallowed
+        with contextlib.redirect_stdout(io.StringIO()) as buffer:
+            yield buffer
+        return
+    buffer = io.StringIO()
+    previous = getattr(proxy._local, "buffer", None)
+    proxy._local.buffer = buffer
+    try:
+        yield buffer
+    finally:
+        proxy._local.buffer = previous
+
 def _run_task_wrapper(prompt: str) -> str:
-    f = io.StringIO()
-    with contextlib.redirect_stdout(f):
+    with _captured_stdout() as log:
         res = new_task(prompt, latent_mode=True)
         print("\nFinal Return:", res)
-    return f.getvalue()
+    return log.getvalue()
 
 def _run_simulate_wrapper(prompt: str) -> str:
-    f = io.StringIO()
-    with contextlib.redirect_stdout(f):
+    # The UI picks its observations out of the markers latent_execute prints
+    with _captured_stdout() as log:
         res = latent_execute(prompt)
         print("\nLatent Execution Result:", res)
-    return f.getvalue()
+    return log.getvalue()
+
+def _cpu_pool() -> ProcessPoolExecutor:
+    """Process pool for experiment jobs, started on first use."""
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        if _CPU_POOL_CLOSED:
+            raise RuntimeError("Experiment process pool is shut down.")
+        if _CPU_POOL is None:
+            methods = multiprocessing.get_all_start_methods()
+            ctx = multiprocessing.get_context("forkserver" if "forkserver" in methods else None)
+            # Workers import the executor once up front, not per job; only
+            # core modules are pickled by reference, never this app module
+            _CPU_POOL = ProcessPoolExecutor(
+                max_workers=JOB_WORKERS,
+                mp_context=ctx,
+                initializer=importlib.import_module,
+                initargs=(run_probe_suite_to_dict.__module__,),
+            )
+        return _CPU_POOL
+
+def _discard_cpu_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop a broken pool so the next _cpu_pool() call starts a fresh one."""
+    global _CPU_POOL
+    with _CPU_POOL_LOCK:
+        if _CPU_POOL is pool:
+            _CPU_POOL = None
+    pool.shutdown(wait=False, cancel_futures=True)
 
 def _run_experiment_wrapper(
     hypothesis: str,
@@ -97,17 +236,24 @@ def _run_experiment_wrapper(
     include_control: bool
 ) -> Dict[str, Any]:
     """Run a probe suite experiment and return structured results."""
-    f = io.StringIO()
-    with contextlib.redirect_stdout(f):
-        experiment_results = run_probe_suite_to_dict(
-            hypothesis=hypothesis,
-            protocol=protocol,
-            probe_count=probe_count,
-            include_control=include_control
-        )
-    # Attach console output to results
-    experiment_results["console_output"] = f.getvalue()
-    return experiment_results
+    # The worker process runs nothing else, so the suite captures its own
+    # printed log into "console_output"
+    kwargs = dict(
+        hypothesis=hypothesis,
+        protocol=protocol,
+        probe_count=probe_count,
+        include_control=include_control,
+        capture_output=True
+    )
+    pool = _cpu_pool()
+    try:
+        return pool.submit(run_probe_suite_to_dict, **kwargs).result()
+    except BrokenProcessPool as e:
+        # A worker died (OOM kill, segfault) and the pool refuses all further
+        # work. Drop it so the next job gets a fresh one, but fail this job:
+        # it may be what killed the worker, and a retry would kill another.
+        _discard_cpu_pool(pool)
+        raise RuntimeError("Experiment worker process died.") from e
 
 # ---- Jobs ----
 @dataclass
@@ -128,27 +274,181 @@ class Job:
     include_control: Optional[bool] = None
     experiment_results: Optional[Dict[str, Any]] = None
 
-JOBS: Dict[str, Job] = {}
+# Job responses hand the instance straight to orjson, which serializes
+# dataclasses natively without an intermediate dict. Job deliberately has no
+# __slots__: orjson reads a plain instance's __dict__ about twice as fast.
+
+JOBS: "OrderedDict[str, Job]" = OrderedDict()
+_JOBS_LOCK = threading.Lock()  # guards JOBS mutations; plain lookups need no lock
+
+def _drop_job_payload(job: Job) -> None:
+    # Drop large payloads in case a worker still holds a reference
+    job.result = None
+    job.experiment_results = None
 
-def _list_trace_files() -> List[str]:
+# Job ids are 128 random bits as hex, same shape as uuid4().hex. They are cut
+# from one os.urandom batch at a time instead of building a UUID per job.
+_JOB_ID_BATCH = 256
+_JOB_IDS: List[str] = []
+
+def _new_job_id() -> str:
+    try:
+        return _JOB_IDS.pop()
+    except IndexError:
+        raw = os.urandom(16 * _JOB_ID_BATCH)
+        _JOB_IDS.extend(raw[i:i + 16].hex() for i in range(16, len(raw), 16))
+        return raw[:16].hex()
+
+def _put_job(job: Job) -> None:
+    """Register a job, evicting the oldest ones once MAX_JOBS is exceeded."""
+    with _JOBS_LOCK:
+        JOBS[job.id] = job
+        JOBS.move_to_end(job.id)
+        while len(JOBS) > MAX_JOBS:
+            _, evicted = JOBS.popitem(last=False)
+            _drop_job_payload(evicted)
+
+def _reap_jobs(now: float) -> int:
+    """Remove finished jobs older than JOB_TTL; returns how many were dropped."""
+    cutoff = now - JOB_TTL
+    with _JOBS_LOCK:
+        expired = [
+            job_id for job_id, job in JOBS.items()
+            if job.status in ("done", "error") and job.finished_at is not None and job.finished_at < cutoff
+        ]
+        for job_id in expired:
+            _drop_job_payload(JOBS.pop(job_id))
+    return len(expired)
+
+async def _job_reaper() -> None:
+    while True:
+        await asyncio.sleep(JOB_REAP_INTERVAL)
+        _reap_jobs(time.time())
+
+# Job id -> (loop, event) for SSE streams waiting on that job. Workers run in
+# EXECUTOR threads, so they wake the stream through call_soon_threadsafe.
+_JOB_WAITERS: Dict[str, Tuple[asyncio.AbstractEventLoop, asyncio.Event]] = {}
+JOB_STREAM_KEEPALIVE = 15.0
+
+# Accepted job ids, drained by the _job_worker tasks; both are created by
+# _lifespan (_JOB_TASKS also holds the _job_reaper task)
+JOB_QUEUE: "Optional[asyncio.Queue[str]]" = None
+_JOB_TASKS: List[asyncio.Task] = []
+
+def _notify_job_finished(job_id: str) -> None:
+    waiter = _JOB_WAITERS.pop(job_id, None)
+    if waiter is not None:
+        loop, event = waiter
+        loop.call_soon_threadsafe(event.set)
+
+# ---- Trace index ----
+# Ascending (mtime, filename) snapshot kept current by _watch_trace_dir.
+# None while no watcher is running, in which case listings go to disk.
+_TRACE_INDEX: Optional[List[Tuple[float, str]]] = None
+_TRACE_WATCHER: Optional[asyncio.Task] = None
+_TRACE_WATCH_STOP: Optional[asyncio.Event] = None  # set on shutdown to end awatch
+
+def _is_trace_file(name: str) -> bool:
+    return name.startswith("replay_") and name.endswith(".json")
+
+def _scan_trace_dir() -> Tuple[List[str], List[float]]:
+    """Parallel (names, mtimes) of the trace files, one scandir pass."""
+    names: List[str] = []
+    mtimes: List[float] = []
     if not os.path.exists(TRACE_DIR):
-        return []
-    files = [f for f in os.listdir(TRACE_DIR) if f.startswith("replay_") and f.endswith(".json")]
-    files.sort(key=lambda f: os.path.getmtime(os.path.join(TRACE_DIR, f)), reverse=True)
-    return files
+        return names, mtimes
+    with os.scandir(TRACE_DIR) as it:
+        for e in it:
+            if _is_trace_file(e.name):
+                names.append(e.name)
+                mtimes.append(e.stat().st_mtime)
+    return names, mtimes
+
+def _scan_trace_mtimes() -> Dict[str, float]:
+    return dict(zip(*_scan_trace_dir()))
+
+def _newest(names: List[str], mtimes: List[float], limit: Optional[int]) -> List[str]:
+    """Names ordered newest first; with a limit, only the top entries are selected."""
+    order = range(len(names))
+    if limit is not None and limit < len(names):
+        order = heapq.nlargest(limit, order, key=mtimes.__getitem__)
+    else:
+        order = sorted(order, key=mtimes.__getitem__, reverse=True)
+    return [names[i] for i in order]
+
+# (monotonic time, names, mtimes) of the last directory scan, reused for bursts
+# of requests while no watcher is keeping _TRACE_INDEX current
+_TRACE_SCAN_CACHE: Optional[Tuple[float, List[str], List[float]]] = None
+TRACE_SCAN_TTL = 1.0
+
+def _cached_scan() -> Tuple[List[str], List[float]]:
+    global _TRACE_SCAN_CACHE
+    now = time.monotonic()
+    cached = _TRACE_SCAN_CACHE
+    if cached is None or now - cached[0] >= TRACE_SCAN_TTL:
+        cached = _TRACE_SCAN_CACHE = (now, *_scan_trace_dir())
+    return cached[1], cached[2]
+
+def _list_trace_files(limit: Optional[int] = None) -> List[str]:
+    index = _TRACE_INDEX
+    if index is not None:
+        newest = index if limit is None else index[max(len(index) - limit, 0):]
+        return [name for _, name in reversed(newest)]
+    return _newest(*_cached_scan(), limit)
+
+def _trace_count() -> int:
+    index = _TRACE_INDEX
+    if index is not None:
+        return len(index)
+    return len(_cached_scan()[0])
+
+async def _watch_trace_dir(stop_event: asyncio.Event) -> None:
+    """Keep _TRACE_INDEX in sync with TRACE_DIR until stop_event is set."""
+    global _TRACE_INDEX
+    try:
+        from watchfiles import Change, awatch
+    except ImportError:
+        return  # no watcher available: keep scanning on demand
+
+    try:
+        os.makedirs(TRACE_DIR, exist_ok=True)
+        mtimes = _scan_trace_mtimes()
+        _TRACE_INDEX = sorted((m, n) for n, m in mtimes.items())
+        async for changes in awatch(TRACE_DIR, recursive=False, stop_event=stop_event):
+            for change, path in changes:
+                name = os.path.basename(path)
+                if not _is_trace_file(name):
+                    continue
+                if change == Change.deleted:
+                    mtimes.pop(name, None)
+                    continue
+                try:
+                    mtimes[name] = os.path.getmtime(path)
+                except OSError:
+                    mtimes.pop(name, None)
+            _TRACE_INDEX = sorted((m, n) for n, m in mtimes.items())
+    except Exception:
+        pass  # unsupported filesystem etc.: fall back to scanning
+    finally:
+        _TRACE_INDEX = None
+
+def _read_trace(path: str) -> Dict[str, Any]:
+    """Parse a trace file straight from its bytes (single read, no text decode)."""
+    return decode_trace(Path(path).read_bytes())
 
 def _get_trace_summary(filename: str) -> Dict[str, Any]:
     """Reads a trace file and returns summary with quality score."""
     path = os.path.join(TRACE_DIR, filename)
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
+        # Parsed once per file version: _summary_cached keys on (mtime_ns, size)
+        data = _read_trace(path)
 
         result_text = str(data.get("result", ""))
         prompt = str(data.get("prompt", ""))
         timestamp = data.get("timestamp", "")
 
-        # Calculate score if result exists
+        # Calculate score if result exists; scores the full result like the
+        # trace page does, and summaries are cached per file version
         score = 0
         if result_text:
             qs = quality_score(result_text)
@@ -170,23 +470,56 @@ def _get_trace_summary(filename: str) -> Dict[str, Any]:
             "preview": ""
         }
 
-def _guess_new_trace(before: set[str], after: set[str]) -> Optional[str]:
-    added = list(after - before)
-    if not added:
-        return None
-    added.sort(key=lambda f: os.path.getmtime(os.path.join(TRACE_DIR, f)), reverse=True)
-    return added[0]
+def _trace_version(filename: str) -> Tuple[int, int]:
+    """(mtime_ns, size) of a trace; summaries are cached per version."""
+    try:
+        st = os.stat(os.path.join(TRACE_DIR, filename))
+    except OSError:
+        return 0, -1  # unreadable: summary falls back to its error form
+    return st.st_mtime_ns, st.st_size
+
+@lru_cache(maxsize=2048)
+def _summary_cached(filename: str, mtime_ns: int, size: int) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    """
+    (summary, pre-escaped display fields) for one version of a trace.
+    Shared across requests; callers must not mutate either dict.
+    """
+    s = _get_trace_summary(filename)
+
+    # Format prompt snippet
+    prompt_snip = _esc(s["prompt"].strip())
+    if len(prompt_snip) > 80:
+        prompt_snip = prompt_snip[:80] + "..."
+    if not prompt_snip:
+        prompt_snip = "No prompt"
+
+    return s, {
+        "filename": _esc(s["filename"]),
+        "timestamp": _esc(str(s["timestamp"])),
+        "prompt_snip": prompt_snip,
+    }
+
+def _trace_summary(filename: str) -> Tuple[Dict[str, Any], Dict[str, str]]:
+    return _summary_cached(filename, *_trace_version(filename))
+
+def _recent_trace_summaries() -> List[Dict[str, Any]]:
+    files = _list_trace_files(MAX_RECENT_TRACES)
+    return [summary for summary, _ in _SUMMARY_POOL.map(_trace_summary, files)]
 
 def _run_job(job_id: str) -> None:
-    job = JOBS[job_id]
+    job = JOBS.get(job_id)
+    if job is None:
+        return  # evicted before it got to run
     job.status = "running"
     job.started_at = time.time()
 
-    before = set(_list_trace_files())
+    trace_file: Optional[str] = None
     try:
         result = ""
         if job.kind == "research":
+            latest_trace.set(None)  # worker threads are reused across jobs
             result = _run_research(job.prompt or "")
+            trace_file = latest_trace.get()
         elif job.kind == "task":
             result = _run_task_wrapper(job.prompt or "")
         elif job.kind == "simulation":
@@ -202,7 +535,7 @@ def _run_job(job_id: str) -> None:
             job.experiment_results = experiment_results
             result = experiment_results.get("console_output", "")
             # Save experiment trace
-            _save_experiment_trace(job_id, job.prompt or "", experiment_results)
+            trace_file = _save_experiment_trace(job_id, job.prompt or "", experiment_results)
 
         job.result = result
         job.status = "done"
@@ -211,15 +544,28 @@ def _run_job(job_id: str) -> None:
         job.error = str(e)
     finally:
         job.finished_at = time.time()
-        after = set(_list_trace_files())
-        job.trace_file = _guess_new_trace(before, after)
-
-
-def _save_experiment_trace(job_id: str, hypothesis: str, experiment_results: Dict[str, Any]) -> None:
-    """Save experiment results to trace store."""
+        job.trace_file = trace_file
+        _notify_job_finished(job_id)
+
+async def _job_worker(queue: "asyncio.Queue[str]") -> None:
+    loop = asyncio.get_running_loop()
+    while True:
+        job_id = await queue.get()
+        try:
+            # The runners are blocking calls; keep them off the event loop
+            await loop.run_in_executor(EXECUTOR, _run_job, job_id)
+        finally:
+            queue.task_done()
+
+def _save_experiment_trace(job_id: str, hypothesis: str, experiment_results: Dict[str, Any]) -> str:
+    """Save experiment results to trace store and return the trace filename."""
     os.makedirs(TRACE_DIR, exist_ok=True)
-    timestamp = datetime.datetime.utcnow().isoformat()
-    trace_filename = f"replay_{timestamp.replace(':', '-')}.json"
+    now = time.time()
+    utc = time.gmtime(now)
+    # Keep microseconds so traces saved within the same second don't collide
+    frac = f".{int(now % 1 * 1_000_000):06d}"
+    timestamp = time.strftime("%Y-%m-%dT%H:%M:%S", utc) + frac
+    trace_filename = "replay_" + time.strftime("%Y-%m-%dT%H-%M-%S", utc) + frac + ".json"
     trace_path = os.path.join(TRACE_DIR, trace_filename)
 
     trace_data = {
@@ -247,22 +593,16 @@ def _save_experiment_trace(job_id: str, hypothesis: str, experiment_results: Dic
         ]
     }
 
-    with open(trace_path, "w", encoding="utf-8") as f:
-        json.dump(trace_data, f, indent=2)
+    # Stored compact: the trace page pretty-prints on display, and unindented
+    # files are smaller to keep on disk and faster to parse for listings
+    with open(trace_path, "wb", buffering=64 * 1024) as f:
+        f.write(encode_trace(trace_data))
+
+    return trace_filename
 
 # ---- HTML ----
-def _page(title: str, body: str) -> str:
-    return f"""<!doctype html>
-<html lang="en">
-<head>
-  <meta charset="utf-8" />
-  <meta name="viewport" content="width=device-width, initial-scale=1" />
-  <title>{html.escape(title)}</title>
-  <link rel="preconnect" href="https://fonts.googleapis.com">
-  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
-  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
-  <style>
-    :root {{
+# Static stylesheet shared by every page
+_CSS = """    :root {
       --primary: #2563eb;
       --primary-hover: #1d4ed8;
       --bg: #f9fafb;
@@ -272,46 +612,46 @@ def _page(title: str, body: str) -> str:
       --text-muted: #6b7280;
       --radius: 8px;
       --shadow: 0 1px 3px 0 rgb(0 0 0 / 0.1), 0 1px 2px -1px rgb(0 0 0 / 0.1);
-    }}
+    }
 
-    * {{ box-sizing: border-box; }}
+    * { box-sizing: border-box; }
 
-    body {{
+    body {
       font-family: 'Inter', sans-serif;
       background: var(--bg);
       color: var(--text);
       margin: 0;
       padding: 0;
       line-height: 1.5;
-    }}
+    }
 
-    .container {{
+    .container {
       max-width: 1000px;
       margin: 0 auto;
       padding: 24px;
-    }}
+    }
 
-    h1, h2, h3 {{ margin-top: 0; font-weight: 600; letter-spacing: -0.025em; }}
-    h1 {{ font-size: 1.5rem; color: #111; margin-bottom: 24px; }}
-    h2 {{ font-size: 1.125rem; margin-bottom: 12px; }}
+    h1, h2, h3 { margin-top: 0; font-weight: 600; letter-spacing: -0.025em; }
+    h1 { font-size: 1.5rem; color: #111; margin-bottom: 24px; }
+    h2 { font-size: 1.125rem; margin-bottom: 12px; }
 
-    a {{ color: var(--primary); text-decoration: none; }}
-    a:hover {{ text-decoration: underline; }}
+    a { color: var(--primary); text-decoration: none; }
+    a:hover { text-decoration: underline; }
 
-    .card {{
+    .card {
       background: var(--surface);
       border: 1px solid var(--border);
       border-radius: var(--radius);
       box-shadow: var(--shadow);
       padding: 24px;
       margin-bottom: 24px;
-    }}
+    }
 
-    .input-group {{ margin-bottom: 16px; }}
+    .input-group { margin-bottom: 16px; }
 
-    label {{ display: block; font-size: 0.875rem; font-weight: 500; margin-bottom: 6px; color: var(--text-muted); }}
+    label { display: block; font-size: 0.875rem; font-weight: 500; margin-bottom: 6px; color: var(--text-muted); }
 
-    select, textarea, input {{
+    select, textarea, input {
       width: 100%;
       padding: 10px;
       border: 1px solid var(--border);
@@ -319,17 +659,17 @@ def _page(title: str, body: str) -> str:
       font-family: inherit;
       font-size: 0.95rem;
       transition: border-color 0.15s;
-    }}
+    }
 
-    select:focus, textarea:focus, input:focus {{
+    select:focus, textarea:focus, input:focus {
       outline: none;
       border-color: var(--primary);
       box-shadow: 0 0 0 2px rgba(37, 99, 235, 0.1);
-    }}
+    }
 
-    textarea {{ min-height: 120px; resize: vertical; font-family: 'JetBrains Mono', monospace; font-size: 0.9rem; }}
+    textarea { min-height: 120px; resize: vertical; font-family: 'JetBrains Mono', monospace; font-size: 0.9rem; }
 
-    button {{
+    button {
       background: var(--primary);
       color: white;
       border: none;
@@ -339,47 +679,47 @@ def _page(title: str, body: str) -> str:
       cursor: pointer;
       font-size: 0.95rem;
       transition: background-color 0.15s;
-    }}
+    }
 
-    button:hover {{ background: var(--primary-hover); }}
-    button:disabled {{ opacity: 0.7; cursor: not-allowed; }}
+    button:hover { background: var(--primary-hover); }
+    button:disabled { opacity: 0.7; cursor: not-allowed; }
 
-    .btn-secondary {{
+    .btn-secondary {
       background: white;
       color: var(--text);
       border: 1px solid var(--border);
-    }}
-    .btn-secondary:hover {{ background: #f3f4f6; }}
+    }
+    .btn-secondary:hover { background: #f3f4f6; }
 
-    .badge {{
+    .badge {
       display: inline-flex;
       align-items: center;
       padding: 2px 8px;
       border-radius: 9999px;
       font-size: 0.75rem;
       font-weight: 500;
-    }}
+    }
 
-    .badge-score {{ font-weight: 600; font-family: 'JetBrains Mono', monospace; }}
-    .score-high {{ background: #dcfce7; color: #166534; }}
-    .score-med {{ background: #fef9c3; color: #854d0e; }}
-    .score-low {{ background: #fee2e2; color: #991b1b; }}
+    .badge-score { font-weight: 600; font-family: 'JetBrains Mono', monospace; }
+    .score-high { background: #dcfce7; color: #166534; }
+    .score-med { background: #fef9c3; color: #854d0e; }
+    .score-low { background: #fee2e2; color: #991b1b; }
 
-    .trace-list {{ list-style: none; padding: 0; margin: 0; }}
-    .trace-item {{
+    .trace-list { list-style: none; padding: 0; margin: 0; }
+    .trace-item {
       border-bottom: 1px solid var(--border);
       padding: 16px 0;
       display: flex;
       gap: 16px;
       align-items: flex-start;
-    }}
-    .trace-item:last-child {{ border-bottom: none; }}
+    }
+    .trace-item:last-child { border-bottom: none; }
 
-    .trace-main {{ flex: 1; min-width: 0; }}
-    .trace-title {{ font-weight: 500; display: block; margin-bottom: 4px; color: var(--text); }}
-    .trace-meta {{ font-size: 0.8rem; color: var(--text-muted); }}
+    .trace-main { flex: 1; min-width: 0; }
+    .trace-title { font-weight: 500; display: block; margin-bottom: 4px; color: var(--text); }
+    .trace-meta { font-size: 0.8rem; color: var(--text-muted); }
 
-    pre {{
+    pre {
       background: #f3f4f6;
       padding: 16px;
       border-radius: var(--radius);
@@ -387,12 +727,12 @@ def _page(title: str, body: str) -> str:
       font-family: 'JetBrains Mono', monospace;
       font-size: 0.85rem;
       border: 1px solid var(--border);
-    }}
+    }
 
-    .status-area {{ margin-top: 16px; border-top: 1px solid var(--border); padding-top: 16px; display: none; }}
-    .status-area.active {{ display: block; }}
+    .status-area { margin-top: 16px; border-top: 1px solid var(--border); padding-top: 16px; display: none; }
+    .status-area.active { display: block; }
 
-    .spinner {{
+    .spinner {
       display: inline-block;
       width: 12px;
       height: 12px;
@@ -401,37 +741,37 @@ def _page(title: str, body: str) -> str:
       border-top-color: #fff;
       animation: spin 1s ease-in-out infinite;
       margin-left: 8px;
-    }}
-    @keyframes spin {{ to {{ transform: rotate(360deg); }} }}
+    }
+    @keyframes spin { to { transform: rotate(360deg); } }
 
-    details summary {{ cursor: pointer; color: var(--text-muted); font-size: 0.9rem; user-select: none; }}
-    details summary:hover {{ color: var(--primary); }}
-    details[open] summary {{ margin-bottom: 12px; }}
+    details summary { cursor: pointer; color: var(--text-muted); font-size: 0.9rem; user-select: none; }
+    details summary:hover { color: var(--primary); }
+    details[open] summary { margin-bottom: 12px; }
 
     /* Simulation Panel */
-    .sim-panel {{
+    .sim-panel {
       background: #f8fafc;
       border: 1px solid var(--border);
       border-radius: var(--radius);
       padding: 20px;
       margin-top: 16px;
-    }}
-    .sim-row {{ margin-bottom: 16px; }}
-    .sim-row:last-child {{ margin-bottom: 0; }}
-    .sim-label {{
+    }
+    .sim-row { margin-bottom: 16px; }
+    .sim-row:last-child { margin-bottom: 0; }
+    .sim-label {
       font-size: 0.75rem;
       text-transform: uppercase;
       color: var(--text-muted);
       font-weight: 600;
       letter-spacing: 0.05em;
       margin-bottom: 6px;
-    }}
-    .sim-value {{
+    }
+    .sim-value {
       font-size: 0.95rem;
       color: var(--text);
       line-height: 1.6;
-    }}
-    .sim-signals {{
+    }
+    .sim-signals {
         font-family: 'JetBrains Mono', monospace;
         font-size: 0.85rem;
         background: white;
@@ -442,10 +782,10 @@ def _page(title: str, body: str) -> str:
         overflow-y: auto;
         white-space: pre-wrap;
         color: #334155;
-    }}
+    }
 
     /* Verdict Pills */
-    .verdict-pill {{
+    .verdict-pill {
       display: inline-flex;
       align-items: center;
       gap: 6px;
@@ -454,13 +794,13 @@ def _page(title: str, body: str) -> str:
       font-size: 0.85rem;
       font-weight: 600;
       letter-spacing: 0.02em;
-    }}
-    .verdict-stable {{ background: #dcfce7; color: #166534; }}
-    .verdict-failure {{ background: #fee2e2; color: #991b1b; }}
-    .verdict-inconclusive {{ background: #fef3c7; color: #92400e; }}
+    }
+    .verdict-stable { background: #dcfce7; color: #166534; }
+    .verdict-failure { background: #fee2e2; color: #991b1b; }
+    .verdict-inconclusive { background: #fef3c7; color: #92400e; }
 
     /* Hypothesis Box */
-    .hypothesis-box {{
+    .hypothesis-box {
       background: white;
       border-left: 4px solid var(--primary);
       padding: 16px;
@@ -469,18 +809,18 @@ def _page(title: str, body: str) -> str:
       color: #334155;
       margin-bottom: 24px;
       box-shadow: 0 1px 2px rgba(0,0,0,0.05);
-    }}
+    }
 
     /* Status Checklist */
-    .status-checklist {{
+    .status-checklist {
       list-style: none;
       padding: 0;
       margin: 0;
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(140px, 1fr));
       gap: 10px;
-    }}
-    .status-checklist li {{
+    }
+    .status-checklist li {
       display: flex;
       align-items: center;
       gap: 8px;
@@ -489,32 +829,32 @@ def _page(title: str, body: str) -> str:
       background: white;
       border-radius: 6px;
       border: 1px solid var(--border);
-    }}
-    .status-checklist .check {{
+    }
+    .status-checklist .check {
       color: #22c55e;
       font-weight: bold;
       font-size: 1rem;
-    }}
-    .status-checklist .pending {{
+    }
+    .status-checklist .pending {
       color: #d1d5db;
       font-weight: bold;
       font-size: 1rem;
-    }}
+    }
 
     /* Signal Icons */
-    .signal-success {{ color: #22c55e; }}
-    .signal-warning {{ color: #f59e0b; }}
-    .signal-error {{ color: #ef4444; }}
-    .signal-neutral {{ color: #6b7280; }}
+    .signal-success { color: #22c55e; }
+    .signal-warning { color: #f59e0b; }
+    .signal-error { color: #ef4444; }
+    .signal-neutral { color: #6b7280; }
 
     /* Preset Buttons */
-    .preset-buttons {{
+    .preset-buttons {
       display: flex;
       gap: 8px;
       margin-top: 8px;
       flex-wrap: wrap;
-    }}
-    .preset-btn {{
+    }
+    .preset-btn {
       font-size: 0.8rem;
       padding: 6px 12px;
       background: #f3f4f6;
@@ -523,14 +863,14 @@ def _page(title: str, body: str) -> str:
       border-radius: 6px;
       cursor: pointer;
       transition: all 0.15s;
-    }}
-    .preset-btn:hover {{
+    }
+    .preset-btn:hover {
       background: #e5e7eb;
       border-color: var(--primary);
-    }}
+    }
 
     /* Experiment Controls */
-    .experiment-controls {{
+    .experiment-controls {
       display: grid;
       grid-template-columns: 1fr 120px 140px;
       gap: 16px;
@@ -539,210 +879,230 @@ def _page(title: str, body: str) -> str:
       background: #f8fafc;
       border: 1px solid var(--border);
       border-radius: var(--radius);
-    }}
-    .experiment-controls .input-group {{
+    }
+    .experiment-controls .input-group {
       margin-bottom: 0;
-    }}
-    .checkbox-group {{
+    }
+    .checkbox-group {
       display: flex;
       align-items: center;
       gap: 8px;
-    }}
-    .checkbox-group input[type="checkbox"] {{
+    }
+    .checkbox-group input[type="checkbox"] {
       width: auto;
-    }}
+    }
 
     /* Experiment Results Table */
-    .experiment-table {{
+    .experiment-table {
       width: 100%;
       border-collapse: collapse;
       font-size: 0.85rem;
       margin-top: 16px;
-    }}
+    }
     .experiment-table th,
-    .experiment-table td {{
+    .experiment-table td {
       padding: 10px 12px;
       text-align: left;
       border-bottom: 1px solid var(--border);
-    }}
-    .experiment-table th {{
+    }
+    .experiment-table th {
       background: #f8fafc;
       font-weight: 600;
       color: var(--text-muted);
       font-size: 0.75rem;
       text-transform: uppercase;
       letter-spacing: 0.05em;
-    }}
-    .experiment-table tr:hover {{
+    }
+    .experiment-table tr:hover {
       background: #f9fafb;
-    }}
-    .experiment-table .control-row {{
+    }
+    .experiment-table .control-row {
       background: #fefce8;
-    }}
-    .experiment-table .control-row:hover {{
+    }
+    .experiment-table .control-row:hover {
       background: #fef9c3;
-    }}
+    }
 
     /* Outcome Badges */
-    .outcome-badge {{
+    .outcome-badge {
       display: inline-flex;
       align-items: center;
       padding: 4px 10px;
       border-radius: 4px;
       font-size: 0.75rem;
       font-weight: 500;
-    }}
-    .outcome-stable {{ background: #dcfce7; color: #166534; }}
-    .outcome-graceful {{ background: #dbeafe; color: #1e40af; }}
-    .outcome-fallback {{ background: #fef3c7; color: #92400e; }}
-    .outcome-violation {{ background: #fee2e2; color: #991b1b; }}
-    .outcome-halt {{ background: #f3e8ff; color: #7e22ce; }}
-    .outcome-undefined {{ background: #f1f5f9; color: #475569; }}
-    .outcome-infra {{ background: #fecaca; color: #b91c1c; }}
+    }
+    .outcome-stable { background: #dcfce7; color: #166534; }
+    .outcome-graceful { background: #dbeafe; color: #1e40af; }
+    .outcome-fallback { background: #fef3c7; color: #92400e; }
+    .outcome-violation { background: #fee2e2; color: #991b1b; }
+    .outcome-halt { background: #f3e8ff; color: #7e22ce; }
+    .outcome-undefined { background: #f1f5f9; color: #475569; }
+    .outcome-infra { background: #fecaca; color: #b91c1c; }
 
     /* Delta Stats */
-    .delta-card {{
+    .delta-card {
       background: white;
       border: 1px solid var(--border);
       border-radius: var(--radius);
       padding: 16px;
       margin-top: 16px;
-    }}
-    .delta-grid {{
+    }
+    .delta-grid {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(150px, 1fr));
       gap: 16px;
       margin-top: 12px;
-    }}
-    .delta-item {{
+    }
+    .delta-item {
       text-align: center;
-    }}
-    .delta-value {{
+    }
+    .delta-value {
       font-size: 1.5rem;
       font-weight: 600;
       font-family: 'JetBrains Mono', monospace;
-    }}
-    .delta-value.positive {{ color: #16a34a; }}
-    .delta-value.negative {{ color: #dc2626; }}
-    .delta-value.neutral {{ color: #6b7280; }}
-    .delta-label {{
+    }
+    .delta-value.positive { color: #16a34a; }
+    .delta-value.negative { color: #dc2626; }
+    .delta-value.neutral { color: #6b7280; }
+    .delta-label {
       font-size: 0.75rem;
       color: var(--text-muted);
       margin-top: 4px;
-    }}
+    }
 
     /* Structured Fields */
-    .structured-fields {{
+    .structured-fields {
       display: grid;
       grid-template-columns: repeat(auto-fit, minmax(180px, 1fr));
       gap: 12px;
       font-size: 0.85rem;
-    }}
-    .field-item {{
+    }
+    .field-item {
       background: #f8fafc;
       padding: 10px;
       border-radius: 6px;
       border: 1px solid var(--border);
-    }}
-    .field-label {{
+    }
+    .field-label {
       font-size: 0.7rem;
       color: var(--text-muted);
       text-transform: uppercase;
       letter-spacing: 0.05em;
       margin-bottom: 4px;
-    }}
-    .field-value {{
+    }
+    .field-value {
       font-family: 'JetBrains Mono', monospace;
       font-size: 0.8rem;
       color: var(--text);
-    }}
-    .field-value.true {{ color: #16a34a; }}
-    .field-value.false {{ color: #6b7280; }}
+    }
+    .field-value.true { color: #16a34a; }
+    .field-value.false { color: #6b7280; }
 
     /* Probe Detail Expand */
-    .probe-expand {{
+    .probe-expand {
       cursor: pointer;
       user-select: none;
-    }}
-    .probe-expand:hover {{
+    }
+    .probe-expand:hover {
       color: var(--primary);
-    }}
-    .probe-detail {{
+    }
+    .probe-detail {
       display: none;
       padding: 16px;
       background: #f9fafb;
       border-top: 1px solid var(--border);
-    }}
-    .probe-detail.active {{
+    }
+    .probe-detail.active {
       display: block;
-    }}
+    }
+
+"""
+
+# Static assets are served from /static/ so browsers cache them instead of
+# receiving them inline with every page
+_STATIC_DIR = Path(__file__).resolve().parent / "static"
+
+def _etag(content: bytes) -> str:
+    return f'"{hashlib.md5(content).hexdigest()}"'
+
+def _precompress(content: bytes) -> Dict[str, bytes]:
+    """Compress an asset once at import, keyed by Content-Encoding."""
+    variants = {"gzip": gzip.compress(content, compresslevel=9, mtime=0)}
+    try:
+        import brotli
+    except ImportError:
+        pass  # gzip only
+    else:
+        variants["br"] = brotli.compress(content, quality=11)
+    return variants
+
+_CSS_BYTES = _CSS.encode("utf-8")
+_CSS_ETAG = _etag(_CSS_BYTES)
+_CSS_ENCODED = _precompress(_CSS_BYTES)
+_CSS_VERSION = _CSS_ETAG[1:13]  # cache-busting query string for the stylesheet link
+
+_JS_BYTES = (_STATIC_DIR / "dashboard.js").read_bytes()
+_JS_ETAG = _etag(_JS_BYTES)
+_JS_ENCODED = _precompress(_JS_BYTES)
+_JS_VERSION = _JS_ETAG[1:13]  # cache-busting query string for the script tag
 
-  </style>
+_PAGE_HEAD = """<!doctype html>
+<html lang="en">
+<head>
+  <meta charset="utf-8" />
+  <meta name="viewport" content="width=device-width, initial-scale=1" />
+  <title>"""
+_PAGE_STYLE = """</title>
+  <link rel="preconnect" href="https://fonts.googleapis.com">
+  <link rel="preconnect" href="https://fonts.gstatic.com" crossorigin>
+  <link href="https://fonts.googleapis.com/css2?family=Inter:wght@400;500;600&family=JetBrains+Mono:wght@400;500&display=swap" rel="stylesheet">
+  <link rel="stylesheet" href="/static/dashboard.css?v=""" + _CSS_VERSION + """">
 </head>
 <body>
   <div class="container">
-    {body}
+    """
+_PAGE_TAIL = """
   </div>
 </body>
 </html>"""
 
-def _score_badge(score: int) -> str:
-    cls = "score-low"
-    if score >= 80: cls = "score-high"
-    elif score >= 50: cls = "score-med"
-    return f'<span class="badge {cls} badge-score">QS {score}</span>'
-
-# ---- Routes ----
-
-@app.get("/", response_class=HTMLResponse)
-async def home():
-    # Check health
-    health = _check_system_health()
-
-    # Status colors
-    def _status_color(status):
-        if status == "healthy": return "#22c55e"
-        if status == "degraded": return "#f59e0b"
-        return "#ef4444"
+# Chained str.replace rather than str.translate: each replace is a C scan that
+# only copies on a hit, while translate slows to a per-character mapping lookup
+# as soon as the text has anything to escape (every key of a JSON dump does).
+# No early-exit check either: a replace with no hit returns s itself, so a
+# pre-scan for the five characters only adds a pass on text that needs work.
+def _esc(s: str) -> str:
+    """Escape for attributes and text; same output as html.escape(s)."""
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;").replace('"', "&quot;").replace("'", "&#x27;")
+
+def _esc_text(s: str) -> str:
+    """Escape element content only, where quotes are literal text."""
+    return s.replace("&", "&amp;").replace("<", "&lt;").replace(">", "&gt;")
+
+_PAGE_HEAD_BYTES = _PAGE_HEAD.encode("utf-8")
+_PAGE_STYLE_BYTES = _PAGE_STYLE.encode("utf-8")
+_PAGE_TAIL_BYTES = _PAGE_TAIL.encode("utf-8")
+
+def _page_prefix(title: str) -> bytes:
+    """Everything up to the page body; pages end with _PAGE_TAIL_BYTES."""
+    return b"".join((_PAGE_HEAD_BYTES, _esc(title).encode("utf-8"), _PAGE_STYLE_BYTES))
+
+def _score_class(score: int) -> str:
+    if score >= 80: return "score-high"
+    if score >= 50: return "score-med"
+    return "score-low"
+
+# Quality scores are clamped to 0..100, so every badge can be built up front
+_BADGE_HTML = tuple(
+    f'<span class="badge {_score_class(s)} badge-score">QS {s}</span>' for s in range(101)
+)
 
-    scroll_color = _status_color(health["scroll_engine"])
-    ollama_color = _status_color(health["ollama"])
-
-    # Gather recent traces
-    files = _list_trace_files()[:MAX_RECENT_TRACES]
-    traces_html = ""
+def _score_badge(score: int) -> str:
+    return _BADGE_HTML[max(0, min(100, int(score)))]
 
-    if not files:
-        traces_html = '<div style="padding: 24px; text-align: center; color: var(--text-muted);">No traces recorded yet. Run a job to generate one.</div>'
-    else:
-        for f in files:
-            s = _get_trace_summary(f)
-            url = f"/trace/{f}"
-
-            # Format prompt snippet
-            prompt_snip = html.escape(s["prompt"].strip())
-            if len(prompt_snip) > 80:
-                prompt_snip = prompt_snip[:80] + "..."
-            if not prompt_snip:
-                prompt_snip = "No prompt"
-
-            # Time formatting
-            ts_str = s["timestamp"]
-            # Basic relative time could go here, for now just show string or simplified
-
-            badge = _score_badge(s["score"])
-
-            # Trust signal badge
-            trust_signal = ""
-            # Heuristic logic for trust signal based on prompt or filename content
-            if "experiment" in s.get("preview", "").lower() or "probe" in s.get("preview", "").lower():
-                 trust_signal = '<span class="badge score-med" style="background:#e0e7ff; color:#3730a3; margin-left:8px;">Control-Compared</span>'
-            elif "execution plan" in s.get("preview", "").lower():
-                 trust_signal = '<span class="badge score-med" style="background:#f0fdf4; color:#166534; margin-left:8px;">Heuristic-Scored</span>'
-            elif "research" in s.get("preview", "").lower() or "findings" in s.get("preview", "").lower():
-                 trust_signal = '<span class="badge score-med" style="background:#fefce8; color:#854d0e; margin-left:8px;">Deep Research</span>'
-
-            traces_html += f"""
+# One row of the "Replayable JSON Traces" list on the home page
+_TRACE_ROW = """
             <div class="trace-item">
                 <div style="padding-top: 2px;">{badge}</div>
                 <div class="trace-main">
@@ -751,7 +1111,7 @@ async def home():
                         {trust_signal}
                     </div>
                     <div class="trace-meta">
-                        {html.escape(s['filename'])} &bull; {html.escape(ts_str)}
+                        {filename} &bull; {timestamp}
                     </div>
                 </div>
                 <div>
@@ -760,7 +1120,38 @@ async def home():
             </div>
             """
 
-    body = f"""
+def _render_trace_row(s: Dict[str, Any], display: Dict[str, str]) -> str:
+    url = f"/trace/{s['filename']}"
+
+    badge = _score_badge(s["score"])
+
+    # Trust signal badge
+    trust_signal = ""
+    # Heuristic logic for trust signal based on prompt or filename content
+    if "experiment" in s.get("preview", "").lower() or "probe" in s.get("preview", "").lower():
+         trust_signal = '<span class="badge score-med" style="background:#e0e7ff; color:#3730a3; margin-left:8px;">Control-Compared</span>'
+    elif "execution plan" in s.get("preview", "").lower():
+         trust_signal = '<span class="badge score-med" style="background:#f0fdf4; color:#166534; margin-left:8px;">Heuristic-Scored</span>'
+    elif "research" in s.get("preview", "").lower() or "findings" in s.get("preview", "").lower():
+         trust_signal = '<span class="badge score-med" style="background:#fefce8; color:#854d0e; margin-left:8px;">Deep Research</span>'
+
+    return _TRACE_ROW.format(
+        badge=badge,
+        url=url,
+        prompt_snip=display["prompt_snip"],
+        trust_signal=trust_signal,
+        filename=display["filename"],
+        timestamp=display["timestamp"],
+    )
+
+# Health status -> indicator dot color (anything else renders red)
+_STATUS_COLORS = {"healthy": "#22c55e", "degraded": "#f59e0b"}
+
+_NO_TRACES_HTML = '<div style="padding: 24px; text-align: center; color: var(--text-muted);">No traces recorded yet. Run a job to generate one.</div>'
+
+# Static pieces of the home page, in render order. The System Modules card is
+# the only part that depends on request-time state besides the trace rows.
+_HOME_HEAD = _PAGE_HEAD + _esc("MoDEM Dashboard") + _PAGE_STYLE + """
     <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 24px;">
         <div style="display: flex; align-items: center; gap: 12px;">
              <!-- Simple Logo SVG or Text -->
@@ -774,31 +1165,35 @@ async def home():
         <div class="badge score-med">v0.1.0</div>
     </div>
 
-    <div class="card">
+"""
+
+_HOME_MODULES = """    <div class="card">
         <h2>System Modules</h2>
         <div class="status-checklist" style="grid-template-columns: repeat(auto-fit, minmax(200px, 1fr));">
              <div class="field-item" style="background: white;">
                 <div class="field-label">Scroll Engine</div>
                 <div style="display: flex; align-items: center; gap: 8px;">
                     <div style="width: 10px; height: 10px; border-radius: 50%; background: {scroll_color};"></div>
-                    <span style="font-weight: 500;">{health["scroll_engine"]}</span>
+                    <span style="font-weight: 500;">{scroll_status}</span>
                 </div>
              </div>
              <div class="field-item" style="background: white;">
                 <div class="field-label">Ollama (Model Service)</div>
                 <div style="display: flex; align-items: center; gap: 8px;">
                     <div style="width: 10px; height: 10px; border-radius: 50%; background: {ollama_color};"></div>
-                    <span style="font-weight: 500;">{health["ollama"]}</span>
+                    <span style="font-weight: 500;">{ollama_status}</span>
                 </div>
              </div>
              <div class="field-item" style="background: white;">
                 <div class="field-label">Trace Store</div>
-                <div style="font-family: 'JetBrains Mono'; font-weight: 600;">{health["trace_count"]} Files</div>
+                <div style="font-family: 'JetBrains Mono'; font-weight: 600;">{trace_count} Files</div>
              </div>
         </div>
     </div>
 
-    <div class="card">
+"""
+
+_HOME_SESSION = """    <div class="card">
         <h2>New Session</h2>
         <div class="input-group">
             <label>Mode</label>
@@ -862,718 +1257,128 @@ async def home():
             <a href="/api/traces" style="font-size: 0.85rem;">JSON API</a>
         </div>
         <div class="trace-list">
-            {traces_html}
+            """
+
+_HOME_SCRIPT = """
         </div>
     </div>
 
-    <script>
-      const MODE_DESC = {{
-        "research": "Executes a deep research session to gather information and context.",
-        "task": "Decomposes an objective into candidate strategies, scores them, selects a plan, and executes it through MAPLE.",
-        "simulation": "Runs a hypothesis-driven probe to observe failure modes, heuristics, and emergent behavior. Useful for safety analysis and experimentation."
-      }};
-
-      const MODE_LABELS = {{
-        "research": "Prompt / Objective",
-        "task": "Prompt / Objective",
-        "simulation": "Hypothesis or Constraint to Probe"
-      }};
-
-      const MODE_PLACEHOLDERS = {{
-        "research": "Describe your research goal or task...",
-        "task": "Describe your research goal or task...",
-        "simulation": 'E.g. "What happens if the system is given ambiguous constraints?" or "Does the planner collapse under conflicting goals?"'
-      }};
-
-      function escapeHtml(text) {{
-        if (!text) return text;
-        return text
-          .replace(/&/g, "&amp;")
-          .replace(/</g, "&lt;")
-          .replace(/>/g, "&gt;")
-          .replace(/"/g, "&quot;")
-          .replace(/'/g, "&#039;");
-      }}
-
-      function renderSimulationOutput(job) {{
-        const result = job.result || "";
-        const prompt = job.prompt || "";
-        const resultLower = result.toLowerCase();
-
-        // 1. Determine Lifecycle Status (5 steps)
-        const lifecycle = {{
-          registered: true,  // Always true if job exists
-          injected: resultLower.includes("latent") || result.length > 0,
-          executed: result.includes("Latent Execution Result") || resultLower.includes("reasoning"),
-          analyzed: result.includes("No actionable") || result.includes("Triggering") || resultLower.includes("fallback") || resultLower.includes("conflict"),
-          interpreted: true  // Always true if we're rendering
-        }};
-
-        const lifecycleHtml = `
-        <ul class="status-checklist" aria-label="Simulation Status">
-          <li><span class="${{lifecycle.registered ? 'check' : 'pending'}}" aria-hidden="true">${{lifecycle.registered ? '✓' : '○'}}</span> Registered</li>
-          <li><span class="${{lifecycle.injected ? 'check' : 'pending'}}" aria-hidden="true">${{lifecycle.injected ? '✓' : '○'}}</span> Injected</li>
-          <li><span class="${{lifecycle.executed ? 'check' : 'pending'}}" aria-hidden="true">${{lifecycle.executed ? '✓' : '○'}}</span> Executed</li>
-          <li><span class="${{lifecycle.analyzed ? 'check' : 'pending'}}" aria-hidden="true">${{lifecycle.analyzed ? '✓' : '○'}}</span> Analyzed</li>
-          <li><span class="${{lifecycle.interpreted ? 'check' : 'pending'}}" aria-hidden="true">${{lifecycle.interpreted ? '✓' : '○'}}</span> Interpreted</li>
-        </ul>
-        `;
-
-        // 2. Generate Observations with Icons
-        let observations = [];
-
-        // Strategy Collapse
-        if (resultLower.includes("conflict") && (resultLower.includes("abandoning") || resultLower.includes("collapse") || resultLower.includes("failed"))) {{
-             observations.push({{ icon: "⚠", cls: "signal-warning", text: "Strategy collapse detected after initial reasoning" }});
-        }} else if (resultLower.includes("conflict")) {{
-             observations.push({{ icon: "⚠", cls: "signal-warning", text: "Conflicting goals detected in input constraints" }});
-        }}
-
-        // Fallback
-        if (resultLower.includes("fallback") || resultLower.includes("defaulting")) {{
-            let reason = "underspecified objective";
-            if (resultLower.includes("conflict")) reason = "conflicting constraints";
-            else if (resultLower.includes("ambiguous") || resultLower.includes("unclear")) reason = "underspecified objective";
-            else if (resultLower.includes("error")) reason = "system error";
-
-            observations.push({{ icon: "⚠", cls: "signal-warning", text: "Fallback heuristic triggered due to " + reason }});
-        }}
-
-        // Success indicators
-        if (result.includes("Triggering Coconut mutation loop")) {{
-            observations.push({{ icon: "✓", cls: "signal-success", text: "Downstream simulation trigger activated" }});
-        }}
-        if (result.includes("Scroll saved to")) {{
-            observations.push({{ icon: "✓", cls: "signal-success", text: "Simulation artifact persisted" }});
-        }}
-
-        // No Mapping
-        if (result.includes("No actionable scroll-to-gene patterns")) {{
-             observations.push({{ icon: "✖", cls: "signal-error", text: "No scroll-to-gene mapping identified" }});
-        }}
-
-        // Early Termination
-        if (result.includes("Failed to reach Coconut") || result.includes("Connection refused")) {{
-             observations.push({{ icon: "✖", cls: "signal-error", text: "Latent execution terminated early due to backend failure" }});
-        }}
-
-        // Ambiguity (if not covered by fallback)
-        if ((resultLower.includes("ambiguous") || resultLower.includes("unclear")) && !observations.some(o => o.text.includes("Fallback"))) {{
-             observations.push({{ icon: "⚠", cls: "signal-warning", text: "Ambiguous constraints identified without clear resolution" }});
-        }}
-
-        // Neutral/informational
-        if (observations.length === 0) {{
-            observations.push({{ icon: "•", cls: "signal-neutral", text: "Latent reasoning completed without specific event markers" }});
-        }}
-
-        const obsListHtml = observations.map(obs =>
-          `<li><span class="${{obs.cls}}" style="font-weight:bold; margin-right:8px;" aria-hidden="true">${{obs.icon}}</span>${{obs.text}}</li>`
-        ).join("");
-
-        // 3. Determine Verdict & Interpretation
-        const hasTrigger = result.includes("Triggering Coconut mutation loop");
-        const hasNoMatch = result.includes("No actionable scroll-to-gene patterns");
-        const hasError = result.includes("Failed to reach Coconut");
-        const hasAmbiguity = resultLower.includes("ambiguous") || resultLower.includes("unclear");
-        const hasConflict = resultLower.includes("conflict");
-        const hasFallback = resultLower.includes("fallback") || resultLower.includes("defaulting");
-
-        let verdictClass = "verdict-inconclusive";
-        let verdictIcon = "🟡";
-        let verdictText = "Inconclusive";
-        let interpretation = "";
-
-        if (hasError) {{
-          verdictClass = "verdict-failure";
-          verdictIcon = "🔴";
-          verdictText = "Failure Mode";
-          interpretation = "The system correctly identified a trigger condition but execution was forcefully terminated by an infrastructure failure, preventing downstream effects.";
-        }} else if (hasTrigger) {{
-          verdictClass = "verdict-stable";
-          verdictIcon = "🟢";
-          verdictText = "Stable";
-          interpretation = "The system successfully resolved the hypothesis into a concrete biological pattern and executed the corresponding simulation pipeline, indicating stable alignment.";
-        }} else if (hasFallback && (hasConflict || hasAmbiguity)) {{
-          verdictClass = "verdict-failure";
-          verdictIcon = "🔴";
-          verdictText = "Failure Mode";
-          interpretation = "This pattern suggests the planner lacks a stable decision heuristic under ambiguous or conflicting constraints, defaulting to conservative fallback behavior rather than exploratory resolution.";
-        }} else if (hasConflict) {{
-          verdictClass = "verdict-failure";
-          verdictIcon = "🔴";
-          verdictText = "Failure Mode";
-          interpretation = "The system detected mutually exclusive goals but failed to resolve a coherent strategy, resulting in a stalled execution state.";
-        }} else if (hasAmbiguity && hasNoMatch) {{
-          verdictClass = "verdict-inconclusive";
-          verdictIcon = "🟡";
-          verdictText = "Inconclusive";
-          interpretation = "The system detected ambiguity in the input constraints and correctly halted execution to avoid speculative simulation, prioritizing safety over action.";
-        }} else if (hasNoMatch) {{
-          verdictClass = "verdict-inconclusive";
-          verdictIcon = "🟡";
-          verdictText = "Inconclusive";
-          interpretation = "The system evaluated the hypothesis but found insufficient evidence or specificity to warrant a downstream simulation trigger.";
-        }} else {{
-          interpretation = "The system engaged in latent reasoning but did not reach a definitive conclusion or action state.";
-        }}
-
-        const verdictBadge = `<span class="verdict-pill ${{verdictClass}}">${{verdictIcon}} ${{verdictText}}</span>`;
-
-        // 4. Raw Logs (Collapsed)
-        const logsHtml = `
-        <details style="margin-top: 20px;">
-            <summary style="font-weight: 500; color: #64748b;">Raw Execution Log</summary>
-            <pre class="sim-signals" style="margin-top: 12px;">${{escapeHtml(result) || "No logs captured."}}</pre>
-        </details>
-        `;
-
-        // 5. Render Complete Panel
-        return `
-        <div class="sim-panel" id="simulation-output">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 24px;">
-              <h3 style="margin:0; font-size:1.1rem;">Experiment Results</h3>
-              ${{verdictBadge}}
-            </div>
+    <script src="/static/dashboard.js?v=""" + _JS_VERSION + """" defer></script>
+    """ + _PAGE_TAIL
 
-            <div style="margin-bottom: 24px;">
-              <div class="sim-label" style="margin-bottom: 10px;">Simulation Status</div>
-              ${{lifecycleHtml}}
-            </div>
+# Static chunks pre-encoded once so streaming them skips a per-request encode
+_HOME_HEAD_BYTES = _HOME_HEAD.encode("utf-8")
+_HOME_SESSION_BYTES = _HOME_SESSION.encode("utf-8")
+_HOME_SCRIPT_BYTES = _HOME_SCRIPT.encode("utf-8")
+_NO_TRACES_BYTES = _NO_TRACES_HTML.encode("utf-8")
 
-            <div style="margin-bottom: 24px;">
-              <div class="sim-label" style="margin-bottom: 10px;">Hypothesis Under Test</div>
-              <div class="hypothesis-box">"${{escapeHtml(prompt)}}"</div>
-            </div>
-
-            <div style="margin-bottom: 24px;">
-              <div class="sim-label" style="margin-bottom: 10px;">Simulation Observations <span class="badge score-high" style="margin-left:8px; font-size:0.7rem;">Deterministic Probe</span></div>
-              <ul style="margin: 0; padding-left: 24px; font-size: 0.9rem; color: var(--text);">
-                ${{obsListHtml}}
-              </ul>
-            </div>
-
-            <div style="margin-bottom: 0;">
-              <div class="sim-label" style="margin-bottom: 10px;">Interpretation</div>
-              <div class="sim-value" style="font-weight: 400; color: #334155; line-height: 1.7;">
-                ${{interpretation}}
-              </div>
-            </div>
+async def _home_iter():
+    # Static head goes out before any health probe or disk access
+    yield _HOME_HEAD_BYTES
 
-            ${{logsHtml}}
-        </div>
-        `;
-      }}
-
-      // Outcome type to CSS class mapping
-      const OUTCOME_CLASSES = {{
-        "stable_execution": "outcome-stable",
-        "graceful_degradation": "outcome-graceful",
-        "fallback_triggered": "outcome-fallback",
-        "constraint_violation": "outcome-violation",
-        "safety_halt": "outcome-halt",
-        "undefined_behavior": "outcome-undefined",
-        "infrastructure_failure": "outcome-infra"
-      }};
-
-      // Outcome type to display label mapping
-      const OUTCOME_LABELS = {{
-        "stable_execution": "Stable",
-        "graceful_degradation": "Graceful Deg.",
-        "fallback_triggered": "Fallback",
-        "constraint_violation": "Violation",
-        "safety_halt": "Safety Halt",
-        "undefined_behavior": "Undefined",
-        "infrastructure_failure": "Infra Failure"
-      }};
-
-      // Protocol display names
-      const PROTOCOL_LABELS = {{
-        "conflict_stress": "Conflict Stress",
-        "underspecification_stress": "Underspecification Stress",
-        "ambiguity_stress": "Ambiguity Stress",
-        "safety_boundary": "Safety Boundary",
-        "control": "Control (Baseline)"
-      }};
-
-      function renderOutcomeBadge(outcomeType, confidence) {{
-        const cls = OUTCOME_CLASSES[outcomeType] || "outcome-undefined";
-        const label = OUTCOME_LABELS[outcomeType] || outcomeType;
-        const confPct = Math.round(confidence * 100);
-        return `<span class="outcome-badge ${{cls}}">${{label}} (${{confPct}}%)</span>`;
-      }}
-
-      function renderDeltaValue(value, isPercentage) {{
-        let cls = "neutral";
-        let prefix = "";
-        if (value > 0) {{
-          cls = "positive";
-          prefix = "+";
-        }} else if (value < 0) {{
-          cls = "negative";
-        }}
-        const displayVal = isPercentage ? (value * 100).toFixed(1) + "%" : value.toFixed(3);
-        return `<div class="delta-value ${{cls}}">${{prefix}}${{displayVal}}</div>`;
-      }}
-
-      function renderStructuredFields(fields) {{
-        const termMode = fields.termination_mode || "unknown";
-        const fallbackUsed = fields.fallback_used ? "Yes" : "No";
-        const mappings = (fields.mapping_evidence || []).length;
-        const heuristics = (fields.heuristics_triggered || []).length;
-        const uncertainty = (fields.uncertainty_markers || []).length;
-
-        return `
-          <div class="structured-fields">
-            <div class="field-item">
-              <div class="field-label">Termination Mode</div>
-              <div class="field-value">${{termMode.replace(/_/g, " ")}}</div>
-            </div>
-            <div class="field-item">
-              <div class="field-label">Fallback Used</div>
-              <div class="field-value ${{fields.fallback_used ? 'true' : 'false'}}">${{fallbackUsed}}</div>
-            </div>
-            <div class="field-item">
-              <div class="field-label">Mappings Found</div>
-              <div class="field-value">${{mappings}}</div>
-            </div>
-            <div class="field-item">
-              <div class="field-label">Heuristics Triggered</div>
-              <div class="field-value">${{heuristics}}</div>
-            </div>
-            <div class="field-item">
-              <div class="field-label">Uncertainty Markers</div>
-              <div class="field-value">${{uncertainty}}</div>
-            </div>
-          </div>
-        `;
-      }}
-
-      function toggleProbeDetail(probeId) {{
-        const detail = document.getElementById("detail-" + probeId);
-        if (detail) {{
-          if (detail.style.display === "none") {{
-            detail.style.display = "table-row";
-          }} else {{
-            detail.style.display = "none";
-          }}
-        }}
-      }}
-
-      function renderExperimentOutput(job) {{
-        const exp = job.experiment_results;
-        if (!exp) return "<p>No experiment results available.</p>";
-
-        const hypothesis = exp.hypothesis || job.prompt || "";
-        const protocol = exp.protocol || "unknown";
-        const probes = exp.probes || [];
-        const controlProbe = exp.control_probe;
-        const aggregateStats = exp.aggregate_stats || {{}};
-        const deltaVsControl = exp.delta_vs_control || {{}};
-
-        // Header with protocol and stats
-        const protocolLabel = PROTOCOL_LABELS[protocol] || protocol;
-        const totalProbes = aggregateStats.total_probes || probes.filter(p => !p.is_control).length;
-        const stabilityScore = aggregateStats.stability_score || 0;
-        const mostCommon = aggregateStats.most_common_outcome || "N/A";
-        const mostCommonLabel = OUTCOME_LABELS[mostCommon] || mostCommon;
-
-        // Determine overall verdict based on divergence and stability
-        let verdictClass = "verdict-inconclusive";
-        let verdictIcon = "~";
-        let verdictText = "Inconclusive";
-
-        const divergence = deltaVsControl.divergence_score || 0;
-        if (divergence >= 0.5) {{
-          verdictClass = "verdict-failure";
-          verdictIcon = "!";
-          verdictText = "Significant Divergence";
-        }} else if (stabilityScore >= 0.8 && mostCommon === "stable_execution") {{
-          verdictClass = "verdict-stable";
-          verdictIcon = "=";
-          verdictText = "Stable";
-        }} else if (stabilityScore >= 0.6) {{
-          verdictClass = "verdict-inconclusive";
-          verdictIcon = "~";
-          verdictText = "Moderate Variance";
-        }}
-
-        const verdictBadge = `<span class="verdict-pill ${{verdictClass}}">${{verdictIcon}} ${{verdictText}}</span>`;
-
-        // Build probe table rows
-        let probeRows = "";
-        probes.forEach((probe, idx) => {{
-          const rowClass = probe.is_control ? "control-row" : "";
-          const typeLabel = probe.is_control ? "CONTROL" : `Probe ${{idx + 1}}`;
-          const outcomeHtml = renderOutcomeBadge(probe.outcome_type, probe.outcome_confidence);
-          const fields = probe.structured_fields || {{}};
-          const fallbackIcon = fields.fallback_used ? '<span style="color: #f59e0b;">Yes</span>' : '<span style="color: #6b7280;">No</span>';
-          const execTime = (probe.execution_time_ms || 0).toFixed(0);
-
-          probeRows += `
-            <tr class="${{rowClass}}">
-              <td>
-                <span class="probe-expand" onclick="toggleProbeDetail('${{probe.probe_id}}')">
-                  <strong>${{typeLabel}}</strong>
-                </span>
-                <div style="font-size: 0.75rem; color: var(--text-muted); margin-top: 4px;">
-                  ${{escapeHtml((probe.probe_text || "").substring(0, 60))}}${{(probe.probe_text || "").length > 60 ? "..." : ""}}
-                </div>
-              </td>
-              <td>${{outcomeHtml}}</td>
-              <td style="font-family: 'JetBrains Mono', monospace; font-size: 0.8rem;">
-                ${{(fields.termination_mode || "unknown").replace(/_/g, " ")}}
-              </td>
-              <td>${{fallbackIcon}}</td>
-              <td style="font-family: 'JetBrains Mono', monospace; font-size: 0.8rem;">${{execTime}}ms</td>
-            </tr>
-            <tr id="detail-${{probe.probe_id}}" style="display: none;">
-              <td colspan="5" style="padding: 0;">
-                <div class="probe-detail active" style="display: block;">
-                  <div style="margin-bottom: 12px;">
-                    <strong>Full Probe Text:</strong>
-                    <div style="margin-top: 8px; padding: 12px; background: white; border: 1px solid var(--border); border-radius: 6px; font-size: 0.85rem;">
-                      ${{escapeHtml(probe.probe_text || "")}}
-                    </div>
-                  </div>
-                  <div style="margin-bottom: 12px;">
-                    <strong>Structured Fields:</strong>
-                    <div style="margin-top: 8px;">
-                      ${{renderStructuredFields(fields)}}
-                    </div>
-                  </div>
-                  <details style="margin-top: 12px;">
-                    <summary style="font-weight: 500; color: #64748b; cursor: pointer;">Raw Output</summary>
-                    <pre class="sim-signals" style="margin-top: 8px; max-height: 200px;">${{escapeHtml(probe.raw_output || "No output captured.")}}</pre>
-                  </details>
-                </div>
-              </td>
-            </tr>
-          `;
-        }});
-
-        // Build delta vs control section
-        let deltaHtml = "";
-        if (deltaVsControl.available) {{
-          const controlOutcome = OUTCOME_LABELS[deltaVsControl.control_outcome] || deltaVsControl.control_outcome;
-          deltaHtml = `
-            <div class="delta-card">
-              <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 12px;">
-                <div style="display: flex; align-items: center;">
-                    <h4 style="margin: 0; font-size: 0.95rem;">Delta vs Control</h4>
-                    <span class="badge score-med" style="background:#e0e7ff; color:#3730a3; margin-left:8px; font-size:0.7rem;">Control-Compared</span>
-                </div>
-                <span class="badge score-med" style="font-size: 0.75rem;">Control: ${{controlOutcome}}</span>
-              </div>
-              <div class="delta-grid">
-                <div class="delta-item">
-                  ${{renderDeltaValue(deltaVsControl.divergence_score || 0, false)}}
-                  <div class="delta-label">Divergence Score</div>
-                </div>
-                <div class="delta-item">
-                  ${{renderDeltaValue(deltaVsControl.delta_confidence || 0, false)}}
-                  <div class="delta-label">Confidence Delta</div>
-                </div>
-                <div class="delta-item">
-                  ${{renderDeltaValue(deltaVsControl.delta_fallback_rate || 0, true)}}
-                  <div class="delta-label">Fallback Rate Delta</div>
-                </div>
-                <div class="delta-item">
-                  ${{renderDeltaValue(deltaVsControl.delta_uncertainty_density || 0, false)}}
-                  <div class="delta-label">Uncertainty Delta</div>
-                </div>
-              </div>
-            </div>
-          `;
-        }}
-
-        // Build outcome distribution
-        const outcomeDist = aggregateStats.outcome_distribution || {{}};
-        let distHtml = "";
-        Object.entries(outcomeDist).forEach(([outcome, count]) => {{
-          const label = OUTCOME_LABELS[outcome] || outcome;
-          const cls = OUTCOME_CLASSES[outcome] || "outcome-undefined";
-          const pct = totalProbes > 0 ? Math.round((count / totalProbes) * 100) : 0;
-          distHtml += `
-            <div style="display: flex; align-items: center; gap: 8px; margin-bottom: 6px;">
-              <span class="outcome-badge ${{cls}}" style="min-width: 100px;">${{label}}</span>
-              <div style="flex: 1; background: #e5e7eb; height: 8px; border-radius: 4px; overflow: hidden;">
-                <div style="width: ${{pct}}%; background: var(--primary); height: 100%;"></div>
-              </div>
-              <span style="font-size: 0.8rem; font-family: 'JetBrains Mono', monospace; min-width: 60px; text-align: right;">${{count}} (${{pct}}%)</span>
-            </div>
-          `;
-        }});
-
-        // Raw console logs
-        const consoleOutput = exp.console_output || job.result || "";
-        const logsHtml = `
-          <details style="margin-top: 20px;">
-            <summary style="font-weight: 500; color: #64748b;">Raw Console Output</summary>
-            <pre class="sim-signals" style="margin-top: 12px; max-height: 300px;">${{escapeHtml(consoleOutput) || "No logs captured."}}</pre>
-          </details>
-        `;
-
-        return `
-          <div class="sim-panel" id="experiment-output">
-            <div style="display: flex; justify-content: space-between; align-items: center; margin-bottom: 24px;">
-              <div>
-                <h3 style="margin:0; font-size:1.1rem;">Experiment Results</h3>
-                <div style="font-size: 0.85rem; color: var(--text-muted); margin-top: 4px;">
-                  Protocol: <strong>${{protocolLabel}}</strong> | Probes: <strong>${{totalProbes}}</strong> | Stability: <strong>${{(stabilityScore * 100).toFixed(0)}}%</strong>
-                </div>
-              </div>
-              ${{verdictBadge}}
-            </div>
+    # Check health
+    health = await run_in_threadpool(_check_system_health)
 
-            <div style="margin-bottom: 24px;">
-              <div class="sim-label" style="margin-bottom: 10px;">Hypothesis Under Test</div>
-              <div class="hypothesis-box">"${{escapeHtml(hypothesis)}}"</div>
-            </div>
+    scroll_color = _STATUS_COLORS.get(health["scroll_engine"], "#ef4444")
+    ollama_color = _STATUS_COLORS.get(health["ollama"], "#ef4444")
 
-            <div style="margin-bottom: 24px;">
-              <div class="sim-label" style="margin-bottom: 10px;">Outcome Distribution</div>
-              <div style="padding: 16px; background: white; border: 1px solid var(--border); border-radius: 6px;">
-                ${{distHtml || '<div style="color: var(--text-muted);">No outcomes recorded</div>'}}
-              </div>
-            </div>
+    yield _HOME_MODULES.format(
+        scroll_color=scroll_color,
+        scroll_status=health["scroll_engine"],
+        ollama_color=ollama_color,
+        ollama_status=health["ollama"],
+        trace_count=health["trace_count"],
+    )
+    yield _HOME_SESSION_BYTES
 
-            ${{deltaHtml}}
-
-            <div style="margin-top: 24px;">
-              <div class="sim-label" style="margin-bottom: 10px;">Probe Results</div>
-              <div style="overflow-x: auto;">
-                <table class="experiment-table">
-                  <thead>
-                    <tr>
-                      <th style="min-width: 200px;">Probe</th>
-                      <th style="min-width: 120px;">Outcome</th>
-                      <th style="min-width: 140px;">Termination</th>
-                      <th style="min-width: 80px;">Fallback</th>
-                      <th style="min-width: 80px;">Time</th>
-                    </tr>
-                  </thead>
-                  <tbody>
-                    ${{probeRows}}
-                  </tbody>
-                </table>
-              </div>
-            </div>
+    # Gather recent traces, one row per chunk
+    files = await run_in_threadpool(_list_trace_files, MAX_RECENT_TRACES)
+    if not files:
+        yield _NO_TRACES_BYTES
+    # Read/score all summaries concurrently, but emit rows in list order
+    futures = [_SUMMARY_POOL.submit(_trace_summary, f) for f in files]
+    for fut in futures:
+        s, display = await asyncio.wrap_future(fut)
+        yield _render_trace_row(s, display)
 
-            ${{logsHtml}}
-          </div>
-        `;
-      }}
-
-      const PRESETS = [
-        "What happens when the system receives two objectives that directly contradict each other?",
-        "How does the planner behave when given a vague objective with no concrete success criteria?",
-        "Does the system collapse or adapt when presented with constraints designed to trigger edge cases?"
-      ];
-
-      function fillPreset(index) {{
-        const inputEl = document.getElementById("prompt-input");
-        if (inputEl && PRESETS[index]) {{
-          inputEl.value = PRESETS[index];
-          inputEl.focus();
-        }}
-      }}
-
-      function updateModeExplainer() {{
-        const sel = document.getElementById("mode-select");
-        const val = sel.value;
-
-        // Update description
-        const txt = MODE_DESC[val] || "";
-        document.getElementById("mode-explainer").innerText = txt;
-
-        // Update label
-        const label = MODE_LABELS[val] || "Prompt / Objective";
-        const labelEl = document.getElementById("prompt-label");
-        if (labelEl) labelEl.innerText = label;
-
-        // Update placeholder
-        const ph = MODE_PLACEHOLDERS[val] || "Describe your research goal or task...";
-        const inputEl = document.getElementById("prompt-input");
-        if (inputEl) inputEl.placeholder = ph;
-
-        // Show/hide preset buttons for simulation mode
-        const presetButtons = document.getElementById("preset-buttons");
-        if (presetButtons) {{
-          presetButtons.style.display = val === "simulation" ? "flex" : "none";
-        }}
-
-        // Show/hide experiment controls for simulation mode
-        const experimentControls = document.getElementById("experiment-controls");
-        if (experimentControls) {{
-          experimentControls.style.display = val === "simulation" ? "grid" : "none";
-        }}
-      }}
-
-      document.getElementById("mode-select").addEventListener("change", updateModeExplainer);
-      updateModeExplainer();
-
-      async function runJob() {{
-        const mode = document.getElementById("mode-select").value;
-        const prompt = document.getElementById("prompt-input").value.trim();
-        const btn = document.getElementById("run-btn");
-        const statusArea = document.getElementById("status-area");
-        const statusText = document.getElementById("status-text");
-        const resPreview = document.getElementById("result-preview");
-
-        if (!prompt) {{
-          alert("Please enter a prompt.");
-          return;
-        }}
-
-        // UI Reset
-        btn.disabled = true;
-        btn.innerHTML = 'Running... <span class="spinner"></span>';
-        statusArea.classList.add("active");
-        statusText.innerText = "Queueing job...";
-        resPreview.innerHTML = "";
-
-        try {{
-            let endpoint = "/api/" + mode;
-            let payload = {{ prompt }};
-
-            // For simulation mode, use experiment endpoint with probe suite parameters
-            if (mode === "simulation") {{
-              endpoint = "/api/experiment";
-              const protocol = document.getElementById("probe-protocol").value;
-              const probeCount = parseInt(document.getElementById("probe-count").value) || 3;
-              const includeControl = document.getElementById("include-control").checked;
-              payload = {{
-                prompt,
-                protocol,
-                probe_count: probeCount,
-                include_control: includeControl
-              }};
-            }}
-
-            const resp = await fetch(endpoint, {{
-              method: "POST",
-              headers: {{ "Content-Type": "application/json" }},
-              body: JSON.stringify(payload)
-            }});
-
-            if (!resp.ok) throw new Error("Failed to start job");
-            const data = await resp.json();
-
-            pollJob(data.job_id);
-        }} catch (e) {{
-            statusText.innerText = "Error: " + e.message;
-            btn.disabled = false;
-            btn.innerHTML = '<span id="btn-text">Run Session</span>';
-        }}
-      }}
-
-      async function pollJob(jobId) {{
-        const statusText = document.getElementById("status-text");
-        const resPreview = document.getElementById("result-preview");
-        const btn = document.getElementById("run-btn");
-
-        while (true) {{
-          try {{
-              const resp = await fetch("/api/jobs/" + jobId);
-              const job = await resp.json();
-
-              if (job.status === "done") {{
-                statusText.innerText = "Completed.";
-                let html = "";
-                if (job.trace_file) {{
-                    html += '<div style="margin-bottom: 12px;"><a href="/trace/' + job.trace_file + '" class="badge score-high" style="font-size: 0.9rem; padding: 8px 16px; text-decoration: none;">View Full Trace Artifact &rarr;</a></div>';
-                }}
-
-                if (job.kind === "experiment" && job.experiment_results) {{
-                    html += renderExperimentOutput(job);
-                }} else if (job.kind === "simulation") {{
-                    html += renderSimulationOutput(job);
-                }} else {{
-                    html += '<pre>' + escapeHtml(job.result || "No output captured.") + '</pre>';
-                }}
-
-                resPreview.innerHTML = html;
-
-                // Auto-scroll to output for experiment/simulation mode
-                if (job.kind === "experiment" || job.kind === "simulation") {{
-                  setTimeout(() => {{
-                    const outputEl = document.getElementById("experiment-output") || document.getElementById("simulation-output");
-                    if (outputEl) {{
-                      outputEl.scrollIntoView({{ behavior: "smooth", block: "start" }});
-                    }}
-                  }}, 100);
-                }}
-
-                break;
-              }}
-
-              if (job.status === "error") {{
-                statusText.innerText = "Failed.";
-                resPreview.innerHTML = '<div style="color: #ef4444; background: #fef2f2; padding: 12px; border-radius: 6px;">' + (job.error || "Unknown error") + '</div>';
-                break;
-              }}
-
-              statusText.innerText = "Running... (" + Math.round((Date.now()/1000) - job.created_at) + "s)";
-              await new Promise(r => setTimeout(r, 1000));
-          }} catch (e) {{
-              console.error(e);
-              break;
-          }}
-        }}
-
-        btn.disabled = false;
-        btn.innerHTML = '<span id="btn-text">Run Session</span>';
-      }}
-    </script>
-    """
-    return _page("MoDEM Dashboard", body)
+    yield _HOME_SCRIPT_BYTES
 
-def _safe_trace_name(name: str) -> str:
-    base = os.path.basename(name)
-    if base != name or not (base.startswith("replay_") and base.endswith(".json")):
-        raise HTTPException(status_code=400, detail="Invalid trace name")
-    return base
+# ---- Routes ----
 
-@app.get("/trace/{name}", response_class=HTMLResponse)
-async def trace_view(name: str):
-    base = _safe_trace_name(name)
-    path = os.path.join(TRACE_DIR, base)
-    if not os.path.exists(path):
-        raise HTTPException(status_code=404, detail="Trace not found")
+def _pick_encoding(accept_encoding: str, available: Dict[str, bytes]) -> Optional[str]:
+    """Best precompressed variant the client accepts, or None for identity."""
+    qualities: Dict[str, float] = {}
+    for item in accept_encoding.split(","):
+        coding, _, params = item.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        quality = 1.0
+        params = params.strip().lower()
+        if params.startswith("q="):
+            try:
+                quality = float(params[2:])
+            except ValueError:
+                quality = 0.0  # malformed: don't risk an encoding the client can't read
+        qualities[coding] = quality
+    # "*" covers every coding the header doesn't name; q=0 refuses one
+    default = qualities.get("*", 0.0)
+    for coding in ("br", "gzip"):
+        if coding in available and qualities.get(coding, default) > 0:
+            return coding
+    return None
+
+def _asset_response(request: Request, content: bytes, encoded: Dict[str, bytes], etag: str, media_type: str, max_age: int) -> Response:
+    coding = _pick_encoding(request.headers.get("accept-encoding", ""), encoded)
+    if coding is not None:
+        content = encoded[coding]
+        etag = f'{etag[:-1]}-{coding}"'  # each representation needs its own validator
+    headers = {"ETag": etag, "Cache-Control": f"public, max-age={max_age}", "Vary": "Accept-Encoding"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+    if coding is not None:
+        headers["Content-Encoding"] = coding
+    return Response(content=content, media_type=media_type, headers=headers)
+
+@app.get("/static/dashboard.css")
+async def dashboard_css(request: Request):
+    return _asset_response(request, _CSS_BYTES, _CSS_ENCODED, _CSS_ETAG, "text/css", 86400)
+
+@app.get("/static/dashboard.js")
+async def dashboard_js(request: Request):
+    # The page links a content-versioned URL, so the script can be cached long-term
+    return _asset_response(request, _JS_BYTES, _JS_ENCODED, _JS_ETAG, "text/javascript", 31536000)
 
-    with open(path, "r", encoding="utf-8") as f:
-        trace = json.load(f)
+@app.get("/", response_class=HTMLResponse)
+async def home():
+    return StreamingResponse(_home_iter(), media_type="text/html")
 
-    # Extract fields
-    prompt = str(trace.get("prompt", ""))
-    result = str(trace.get("result", ""))
-    timestamp = str(trace.get("timestamp", ""))
-    steps = trace.get("steps", [])
+# Trace filenames look like replay_2026-01-12T14-31-13.849540.json; no path
+# separators are allowed, so a match can't escape TRACE_DIR
+_TRACE_NAME_RE = re.compile(r"\Areplay_[A-Za-z0-9_.\-]+\.json\Z")
 
-    # Calculate score
-    qs = quality_score(result)
-    score_badge = _score_badge(qs["quality"])
+def _safe_trace_name(name: str) -> str:
+    if not _TRACE_NAME_RE.match(name):
+        raise HTTPException(status_code=400, detail="Invalid trace name")
+    return name
 
-    # Formatting
-    prompt_html = html.escape(prompt)
-    result_html = html.escape(result)
+@lru_cache(maxsize=256)
+def _load_trace(path: str, mtime: float) -> Dict[str, Any]:
+    """Parsed trace, cached per file version (mtime invalidates rewrites)."""
+    return _read_trace(path)
 
-    steps_html = ""
-    if steps:
-        steps_json = json.dumps(steps, indent=2)
-        steps_html = f"""
-        <details>
-            <summary>Execution Steps ({len(steps)})</summary>
-            <pre style="margin-top: 12px;">{html.escape(steps_json)}</pre>
-        </details>
-        """
-    else:
-        steps_html = '<p class="muted">No execution steps recorded.</p>'
+def _trace_mtime(base: str) -> float:
+    try:
+        return os.path.getmtime(os.path.join(TRACE_DIR, base))
+    except OSError:
+        raise HTTPException(status_code=404, detail="Trace not found")
 
-    raw_json = json.dumps(trace, indent=2)
+# The steps and raw JSON blocks can run to hundreds of KB, so they are escaped
+# and sent in slices of this many characters instead of as one string
+TRACE_CHUNK_CHARS = 64 * 1024
 
-    body = f"""
+# Trace page body up to the steps block; str.format slots are pre-escaped
+_TRACE_HEAD = """
     <div style="margin-bottom: 24px;">
         <a href="/">&larr; Back to Dashboard</a>
     </div>
@@ -1583,7 +1388,7 @@ async def trace_view(name: str):
             <div>
                 <h1 style="margin-bottom: 8px; font-size: 1.25rem;">Trace Artifact</h1>
                 <div style="color: var(--text-muted); font-size: 0.9rem;">
-                    {html.escape(base)} &bull; {timestamp}
+                    {base} &bull; {timestamp}
                 </div>
             </div>
             <div style="text-align: right;">
@@ -1594,32 +1399,123 @@ async def trace_view(name: str):
 
         <h3>Prompt</h3>
         <div style="background: #f3f4f6; padding: 16px; border-radius: var(--radius); margin-bottom: 24px; font-style: italic; color: #4b5563;">
-            {prompt_html}
+            {prompt}
         </div>
 
         <h3>Result</h3>
-        <pre style="background: #1f2937; color: #f9fafb; border: none;">{result_html}</pre>
+        <pre style="background: #1f2937; color: #f9fafb; border: none;">{result}</pre>
 
         <div style="margin-top: 24px;">
-            {steps_html}
+            {steps_open}"""
+
+_TRACE_STEPS_OPEN = """
+        <details>
+            <summary>Execution Steps ({count})</summary>
+            <pre style="margin-top: 12px;">"""
+
+_TRACE_STEPS_CLOSE = """</pre>
+        </details>
+        """
+
+_TRACE_NO_STEPS = '<p class="muted">No execution steps recorded.</p>'
+
+_TRACE_RAW_OPEN = """
         </div>
     </div>
 
     <div class="card">
         <details>
             <summary>Raw JSON Data</summary>
-            <pre style="margin-top: 12px; max-height: 400px; overflow-y: auto;">{html.escape(raw_json)}</pre>
+            <pre style="margin-top: 12px; max-height: 400px; overflow-y: auto;">"""
+
+_TRACE_RAW_CLOSE = """</pre>
         </details>
     </div>
     """
-    return _page(f"Trace: {base}", body)
+
+_TRACE_STEPS_CLOSE_BYTES = _TRACE_STEPS_CLOSE.encode("utf-8")
+_TRACE_RAW_OPEN_BYTES = _TRACE_RAW_OPEN.encode("utf-8")
+_TRACE_TAIL_BYTES = _TRACE_RAW_CLOSE.encode("utf-8") + _PAGE_TAIL_BYTES
+
+def _open_trace(base: str) -> float:
+    """Stat and parse a trace (blocking), returning the mtime it was cached under."""
+    mtime = _trace_mtime(base)
+    # Parse (and fail) before the response starts, while a 4xx/5xx can still be sent
+    _load_trace(os.path.join(TRACE_DIR, base), mtime)
+    return mtime
+
+@lru_cache(maxsize=64)
+def _trace_page_head(base: str, mtime: float) -> bytes:
+    """Trace page up to the steps JSON, cached per file version like _load_trace."""
+    path = os.path.join(TRACE_DIR, base)
+    trace = _load_trace(path, mtime)
+
+    # Extract fields
+    prompt = str(trace.get("prompt", ""))
+    result = str(trace.get("result", ""))
+    timestamp = str(trace.get("timestamp", ""))
+    steps = trace.get("steps", [])
+
+    # Calculate score
+    qs = quality_score(result)
+    score_badge = _score_badge(qs["quality"])
+
+    # Formatting
+    prompt_html = _esc_text(prompt)
+    result_html = _esc_text(result)
+
+    if steps:
+        steps_open = _TRACE_STEPS_OPEN.format(count=len(steps))
+    else:
+        steps_open = _TRACE_NO_STEPS
+
+    body = _TRACE_HEAD.format(
+        base=_esc(base),
+        timestamp=_esc(timestamp),
+        score_badge=score_badge,
+        prompt=prompt_html,
+        result=result_html,
+        steps_open=steps_open,
+    )
+    return _page_prefix(f"Trace: {base}") + body.encode("utf-8")
+
+def _pretty_json(obj: Any) -> str:
+    """Indented JSON for display, via json when orjson rejects the data (ints beyond 64 bits)."""
+    try:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode()
+    except TypeError:
+        return json.dumps(obj, indent=2, ensure_ascii=False)
+
+def _iter_escaped(text: str) -> Iterator[bytes]:
+    for start in range(0, len(text), TRACE_CHUNK_CHARS):
+        yield _esc_text(text[start:start + TRACE_CHUNK_CHARS]).encode("utf-8")
+
+def _iter_trace_page(base: str, mtime: float) -> Iterator[bytes]:
+    """Trace detail page in chunks; StreamingResponse runs this in a worker thread."""
+    trace = _load_trace(os.path.join(TRACE_DIR, base), mtime)
+    yield _trace_page_head(base, mtime)
+
+    steps = trace.get("steps", [])
+    if steps:
+        yield from _iter_escaped(_pretty_json(steps))
+        yield _TRACE_STEPS_CLOSE_BYTES
+
+    yield _TRACE_RAW_OPEN_BYTES
+    yield from _iter_escaped(_pretty_json(trace))
+    yield _TRACE_TAIL_BYTES
+
+@app.get("/trace/{name}", response_class=HTMLResponse)
+async def trace_view(name: str):
+    base = _safe_trace_name(name)
+    mtime = await run_in_threadpool(_open_trace, base)
+    return StreamingResponse(_iter_trace_page(base, mtime), media_type="text/html")
 
 
 # ---- API Routes ----
 
 @app.get("/health")
 async def health_check():
-    return {"status": "OK"}
+    return ORJSONResponse({"status": "OK"})
 
 @app.post("/api/research")
 async def api_research(payload: Dict[str, Any]):
@@ -1633,30 +1529,47 @@ async def api_task(payload: Dict[str, Any]):
 async def api_simulation(payload: Dict[str, Any]):
     return _create_job("simulation", payload)
 
+ExperimentProtocol = Literal["conflict_stress", "underspecification_stress", "ambiguity_stress", "safety_boundary"]
+_EXPERIMENT_PROTOCOLS = list(get_args(ExperimentProtocol))
+
+class ExperimentRequest(BaseModel):
+    """Body of POST /api/experiment, validated in one pydantic-core call."""
+    prompt: Optional[str] = None
+    protocol: ExperimentProtocol = "underspecification_stress"
+    probe_count: StrictInt = Field(3, ge=1, le=10)  # no "3" or 3.0 coercion
+    include_control: bool = True
+
+def _experiment_error(e: ValidationError) -> str:
+    error = e.errors()[0]
+    field = error["loc"][0] if error["loc"] else None
+    if field == "protocol":
+        return f"Invalid protocol. Must be one of: {_EXPERIMENT_PROTOCOLS}"
+    if field == "probe_count":
+        if error["type"] in ("greater_than_equal", "less_than_equal"):
+            return "Probe count must be between 1 and 10"
+        return "Probe count must be an integer"
+    return "Invalid request body"
+
 @app.post("/api/experiment")
-async def api_experiment(payload: Dict[str, Any]):
+async def api_experiment(request: Request):
     """Create a probe suite experiment job."""
-    prompt = (payload.get("prompt") or "").strip()
+    try:
+        req = ExperimentRequest.model_validate_json(await request.body())
+    except ValidationError as e:
+        raise HTTPException(status_code=400, detail=_experiment_error(e))
+
+    prompt = (req.prompt or "").strip()
     if not prompt:
         raise HTTPException(status_code=400, detail="Missing prompt (hypothesis)")
 
     if len(prompt) > MAX_PROMPT_LENGTH:
         raise HTTPException(status_code=400, detail=f"Prompt too long (max {MAX_PROMPT_LENGTH} chars)")
 
-    protocol = payload.get("protocol", "underspecification_stress")
-    probe_count = int(payload.get("probe_count", 3))
-    include_control = bool(payload.get("include_control", True))
-
-    # Validate protocol
-    valid_protocols = ["conflict_stress", "underspecification_stress", "ambiguity_stress", "safety_boundary"]
-    if protocol not in valid_protocols:
-        raise HTTPException(status_code=400, detail=f"Invalid protocol. Must be one of: {valid_protocols}")
+    protocol = req.protocol
+    probe_count = req.probe_count
+    include_control = req.include_control
 
-    # Validate probe count
-    if probe_count < 1 or probe_count > 10:
-        raise HTTPException(status_code=400, detail="Probe count must be between 1 and 10")
-
-    job_id = uuid.uuid4().hex
+    job_id = _new_job_id()
     job = Job(
         id=job_id,
         kind="experiment",
@@ -1667,9 +1580,17 @@ async def api_experiment(payload: Dict[str, Any]):
         probe_count=probe_count,
         include_control=include_control,
     )
-    JOBS[job_id] = job
-    EXECUTOR.submit(_run_job, job_id)
-    return {"job_id": job_id}
+    _enqueue_job(job)
+    return ORJSONResponse({"job_id": job_id})
+
+def _enqueue_job(job: Job) -> None:
+    """Register a job and hand it to the workers, or 503 if they aren't running."""
+    queue = JOB_QUEUE
+    if queue is None:
+        # _lifespan never ran (e.g. a mounted sub-app or a bare TestClient)
+        raise HTTPException(status_code=503, detail="Job queue not running")
+    _put_job(job)
+    queue.put_nowait(job.id)
 
 def _create_job(kind: str, payload: Dict[str, Any]):
     prompt = (payload.get("prompt") or "").strip()
@@ -1679,7 +1600,7 @@ def _create_job(kind: str, payload: Dict[str, Any]):
     if len(prompt) > MAX_PROMPT_LENGTH:
         raise HTTPException(status_code=400, detail=f"Prompt too long (max {MAX_PROMPT_LENGTH} chars)")
 
-    job_id = uuid.uuid4().hex
+    job_id = _new_job_id()
     job = Job(
         id=job_id,
         kind=kind,
@@ -1687,33 +1608,64 @@ def _create_job(kind: str, payload: Dict[str, Any]):
         created_at=time.time(),
         prompt=prompt,
     )
-    JOBS[job_id] = job
-    EXECUTOR.submit(_run_job, job_id)
-    return {"job_id": job_id}
+    _enqueue_job(job)
+    return ORJSONResponse({"job_id": job_id})
 
 @app.get("/api/jobs/{job_id}")
 async def api_job(job_id: str):
     job = JOBS.get(job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
-    return asdict(job)
+    return ORJSONResponse(job)
+
+async def _job_events(job_id: str):
+    """Yield the job's state as SSE messages: once now, once when it finishes."""
+    job = JOBS.get(job_id)
+    if job is None:
+        return
+    # Register before checking the status: the worker sets the status first and
+    # notifies afterwards, so a job finishing in between still wakes us
+    waiter = _JOB_WAITERS.get(job_id)
+    if waiter is None:
+        waiter = _JOB_WAITERS[job_id] = (asyncio.get_running_loop(), asyncio.Event())
+    event = waiter[1]
+    # Decide from the status sent now, not after resuming: a job finishing
+    # while the first message is written must still get its final message
+    finished = job.status in ("done", "error")
+    yield b"data: " + orjson.dumps(job) + b"\n\n"
+    if finished:
+        _JOB_WAITERS.pop(job_id, None)
+        return
+    while job.status not in ("done", "error"):
+        try:
+            await asyncio.wait_for(event.wait(), JOB_STREAM_KEEPALIVE)
+        except asyncio.TimeoutError:
+            if job_id not in JOBS:
+                # Evicted before it ran; nothing will ever notify us
+                _JOB_WAITERS.pop(job_id, None)
+                return
+            yield b": keepalive\n\n"
+    yield b"data: " + orjson.dumps(job) + b"\n\n"
+
+@app.get("/api/jobs/{job_id}/stream")
+async def api_job_stream(job_id: str):
+    if job_id not in JOBS:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return StreamingResponse(
+        _job_events(job_id),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache"},
+    )
 
 @app.get("/api/traces")
 async def api_traces():
-    if not os.path.exists(TRACE_DIR):
-        return {"traces": []}
-    files = _list_trace_files()[:MAX_RECENT_TRACES]
-    items = []
-    for f in files:
-        s = _get_trace_summary(f)
-        items.append(s)
-    return {"traces": items}
+    # Listing, stats and any uncached parses all touch disk; keep them off the loop
+    items = await run_in_threadpool(_recent_trace_summaries)
+    return ORJSONResponse({"traces": items})
 
 @app.get("/api/trace/{name}")
 async def api_trace_raw(name: str):
     base = _safe_trace_name(name)
-    path = os.path.join(TRACE_DIR, base)
-    if not os.path.exists(path):
-        raise HTTPException(status_code=404, detail="Trace not found")
-    with open(path, "r", encoding="utf-8") as f:
-        return json.load(f)
+    await run_in_threadpool(_trace_mtime, base)  # 404 for missing traces
+    # Trace files are already JSON; send them as-is instead of parsing and re-encoding
+    return FileResponse(os.path.join(TRACE_DIR, base), media_type="application/json")
@@ -1,6 +1,6 @@
 # modemctl/audit.py
 from pathlib import Path
-import json
+import orjson
 
 def audit_scroll(scroll_path):
     path = Path(scroll_path)
@@ -8,8 +8,7 @@ def audit_scroll(scroll_path):
         print("[MAPLE] Scroll not found:", scroll_path)
         return
 
-    with open(path, "r") as f:
-        scroll = json.load(f)
+    scroll = orjson.loads(path.read_bytes())
 
     print("\n[MAPLE AUDIT MODE]")
     print("Scroll ID:", scroll.get("scroll_id"))
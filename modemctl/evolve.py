@@ -1,6 +1,6 @@
 #trigger mutation simulations
 #!/usr/bin/env python3
-import json
+import orjson
 from datetime import datetime
 from pathlib import Path
 
@@ -16,8 +16,7 @@ def evolve_policy():
 
     out_path = Path("modem-os/core/scrolls/mutations/evolved_policy_001.bs")
     out_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(out_path, "w") as f:
-        json.dump(evolved_scroll, f, indent=2)
+    out_path.write_bytes(orjson.dumps(evolved_scroll, option=orjson.OPT_INDENT_2))
 
     print(f"[MAPLE] Mutation output saved: {out_path}")
 
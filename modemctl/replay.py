@@ -5,7 +5,7 @@ It reads the memory scroll from a predefined path, parses it, and
 prints its details.
 Usage: Run this script directly to replay the memory scroll.
 """
-import json
+import orjson
 from pathlib import Path
 
 
@@ -38,8 +38,7 @@ def replay_memory():
         print("[MAPLE] No memory scroll found.")
         return
 
-    with open(memory_path, encoding="utf-8") as f:
-        scroll = json.load(f)
+    scroll = orjson.loads(memory_path.read_bytes())
 
     print("\n[MAPLE] Replaying LSTM Policy Memory Scroll")
     print("Policy ID:", scroll.get("policy_id"))
@@ -11,7 +11,7 @@
 # The script imports necessary modules, defines a function to train the DRL policy,
 # and saves the generated memory scroll to a file. The script also includes
 # a main block to execute the training function when run directly.
-import json
+import orjson
 from pathlib import Path
 
 def train_drl_policy():
@@ -27,8 +27,7 @@ def train_drl_policy():
 
     memory_path = Path("modem-os/core/scrolls/ai/memory/lstm_policy_store.bs")
     memory_path.parent.mkdir(parents=True, exist_ok=True)
-    with open(memory_path, "w") as f:
-        json.dump(event_chain, f, indent=2)
+    memory_path.write_bytes(orjson.dumps(event_chain, option=orjson.OPT_INDENT_2))
 
     print(f"[MAPLE] Memory scroll saved: {memory_path}")
 
@@ -5,17 +5,61 @@ Test runner for MoDEM OS unit tests.
 Runs all unit tests and provides a summary of results.
 """
 
+import io
+import multiprocessing
 import unittest
 import sys
 from pathlib import Path
 
+def _iter_tests(suite):
+    for test in suite:
+        if isinstance(test, unittest.TestSuite):
+            yield from _iter_tests(test)
+        else:
+            yield test
 
-def run_tests(verbose=False):
+
+def _shards(suite, jobs):
+    """
+    Split a suite's test ids into at most `jobs` shards.
+
+    Tests of one class stay in the same shard so setUpClass runs once.
+    """
+    classes = {}
+    for test in _iter_tests(suite):
+        classes.setdefault(test.id().rpartition(".")[0], []).append(test.id())
+    shards = [[] for _ in range(min(jobs, len(classes)))]
+    # Biggest classes first, each onto the currently smallest shard
+    for ids in sorted(classes.values(), key=len, reverse=True):
+        min(shards, key=len).extend(ids)
+    return shards
+
+
+def _run_shard(args):
+    """Run one shard in a worker process; returns picklable result counts."""
+    ids, start_dir, verbosity = args
+    if start_dir not in sys.path:
+        sys.path.insert(0, start_dir)
+    stream = io.StringIO()
+    suite = unittest.TestLoader().loadTestsFromNames(ids)
+    result = unittest.TextTestRunner(stream=stream, verbosity=verbosity).run(suite)
+    return {
+        "output": stream.getvalue(),
+        "testsRun": result.testsRun,
+        "failures": len(result.failures),
+        "errors": len(result.errors),
+        "skipped": len(result.skipped),
+        "successful": result.wasSuccessful(),
+    }
+
+
+def run_tests(verbose=False, jobs=1):
     """
     Run all unit tests in the tests/ directory.
 
     Args:
         verbose: If True, show detailed test output
+        jobs: Number of worker processes; 1 runs everything in this process
 
     Returns:
         True if all tests passed, False otherwise
@@ -27,26 +71,54 @@ def run_tests(verbose=False):
 
     # Run tests with appropriate verbosity
     verbosity = 2 if verbose else 1
-    runner = unittest.TextTestRunner(verbosity=verbosity)
-    result = runner.run(suite)
+    # Fewer than two shards (one test class, or none discovered) gains
+    # nothing from worker processes, and Pool(0) would raise
+    shards = _shards(suite, jobs) if jobs > 1 else []
+    if len(shards) > 1:
+        with multiprocessing.Pool(len(shards)) as pool:
+            results = pool.map(_run_shard, [(ids, str(start_dir), verbosity) for ids in shards])
+        for shard in results:
+            sys.stderr.write(shard["output"])
+        totals = {key: sum(shard[key] for shard in results)
+                  for key in ("testsRun", "failures", "errors", "skipped")}
+        successful = all(shard["successful"] for shard in results)
+    else:
+        runner = unittest.TextTestRunner(verbosity=verbosity)
+        result = runner.run(suite)
+        totals = {
+            "testsRun": result.testsRun,
+            "failures": len(result.failures),
+            "errors": len(result.errors),
+            "skipped": len(result.skipped),
+        }
+        successful = result.wasSuccessful()
 
     # Print summary
     print("\n" + "="*70)
     print("TEST SUMMARY")
     print("="*70)
-    print(f"Tests run: {result.testsRun}")
-    print(f"Successes: {result.testsRun - len(result.failures) - len(result.errors)}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped)}")
+    print(f"Tests run: {totals['testsRun']}")
+    print(f"Successes: {totals['testsRun'] - totals['failures'] - totals['errors']}")
+    print(f"Failures: {totals['failures']}")
+    print(f"Errors: {totals['errors']}")
+    print(f"Skipped: {totals['skipped']}")
     print("="*70)
 
-    return result.wasSuccessful()
+    return successful
+
+
+def _jobs_arg(argv):
+    """Value of -j/--jobs N; 'auto' means one worker per CPU."""
+    for flag in ("-j", "--jobs"):
+        if flag in argv[:-1]:
+            value = argv[argv.index(flag) + 1]
+            return multiprocessing.cpu_count() if value == "auto" else max(int(value), 1)
+    return 1
 
 
 if __name__ == "__main__":
     # Check for verbose flag
     verbose = "-v" in sys.argv or "--verbose" in sys.argv
 
-    success = run_tests(verbose)
+    success = run_tests(verbose, _jobs_arg(sys.argv))
     sys.exit(0 if success else 1)
@@ -0,0 +1,247 @@
+"""
+Unit tests for the dashboard.
+
+Exercises job output capture, the job registry, TTL reaper, SSE event
+stream, experiment request validation and asset content negotiation
+directly, without starting a server.
+"""
+
+import asyncio
+import importlib.util
+import io
+import threading
+import unittest
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_HAS_DASHBOARD_DEPS = all(
+    importlib.util.find_spec(name) for name in ("fastapi", "orjson", "requests")
+)
+if _HAS_DASHBOARD_DEPS:
+    import orjson
+    from modem_api.ui import dashboard
+    from modem_api.ui.dashboard import Job
+
+
+def _job(job_id, status="queued", finished_at=None):
+    return Job(id=job_id, kind="task", status=status, created_at=0.0,
+               finished_at=finished_at, result="output")
+
+
+@unittest.skipUnless(_HAS_DASHBOARD_DEPS, "dashboard dependencies not installed")
+class TestJobOutputCapture(unittest.TestCase):
+    """Test per-thread stdout capture for job logs."""
+
+    def test_proxy_is_restored_on_exit(self):
+        """_thread_stdout swaps sys.stdout only for its own lifetime."""
+        original = sys.stdout
+        with dashboard._thread_stdout():
+            self.assertIsInstance(sys.stdout, dashboard._ThreadStdout)
+        self.assertIs(sys.stdout, original)
+
+    def test_capture_excludes_other_threads(self):
+        """A job's log holds its own thread's output, not other threads'."""
+        real = io.StringIO()
+        saved, sys.stdout = sys.stdout, real
+        try:
+            with dashboard._thread_stdout():
+                with dashboard._captured_stdout() as log:
+                    print("job line")
+                    other = threading.Thread(target=print, args=("other line",))
+                    other.start()
+                    other.join()
+        finally:
+            sys.stdout = saved
+        self.assertEqual(log.getvalue(), "job line\n")
+        self.assertEqual(real.getvalue(), "other line\n")
+
+    def test_capture_without_proxy(self):
+        """Outside a running server the log is still collected."""
+        with dashboard._captured_stdout() as log:
+            print("direct call")
+        self.assertEqual(log.getvalue(), "direct call\n")
+
+
+@unittest.skipUnless(_HAS_DASHBOARD_DEPS, "dashboard dependencies not installed")
+class TestJobRegistry(unittest.TestCase):
+    """Test job registration, eviction and reaping."""
+
+    def setUp(self):
+        self._saved_jobs = dashboard.JOBS.copy()
+        dashboard.JOBS.clear()
+
+    def tearDown(self):
+        dashboard.JOBS.clear()
+        dashboard.JOBS.update(self._saved_jobs)
+
+    def test_reap_jobs_drops_only_expired_finished_jobs(self):
+        """Only done/error jobs finished more than JOB_TTL ago are removed."""
+        now = 10 * dashboard.JOB_TTL
+        old = now - dashboard.JOB_TTL - 1
+        recent = now - dashboard.JOB_TTL + 1
+        jobs = [
+            _job("old-done", "done", old),
+            _job("old-error", "error", old),
+            _job("recent-done", "done", recent),
+            _job("queued"),
+            _job("running", "running"),
+        ]
+        for job in jobs:
+            dashboard._put_job(job)
+
+        self.assertEqual(dashboard._reap_jobs(now), 2)
+        self.assertEqual(list(dashboard.JOBS), ["recent-done", "queued", "running"])
+        # Reaped jobs release their payloads
+        self.assertIsNone(jobs[0].result)
+        self.assertEqual(jobs[2].result, "output")
+
+    def test_enqueue_without_running_queue_is_503(self):
+        """Jobs are refused, not half-registered, when _lifespan hasn't started the queue."""
+        self.assertIsNone(dashboard.JOB_QUEUE)
+        with self.assertRaises(dashboard.HTTPException) as caught:
+            dashboard._enqueue_job(_job("unqueued"))
+        self.assertEqual(caught.exception.status_code, 503)
+        self.assertNotIn("unqueued", dashboard.JOBS)
+
+    def test_put_job_evicts_oldest_beyond_max_jobs(self):
+        """The registry never holds more than MAX_JOBS, dropping the oldest."""
+        total = dashboard.MAX_JOBS + 3
+        jobs = [_job(f"job-{i}") for i in range(total)]
+        for job in jobs:
+            dashboard._put_job(job)
+
+        self.assertEqual(len(dashboard.JOBS), dashboard.MAX_JOBS)
+        self.assertNotIn("job-0", dashboard.JOBS)
+        self.assertIn("job-3", dashboard.JOBS)
+        self.assertIn(f"job-{total - 1}", dashboard.JOBS)
+        self.assertIsNone(jobs[0].result)
+
+
+@unittest.skipUnless(_HAS_DASHBOARD_DEPS, "dashboard dependencies not installed")
+class TestJobEvents(unittest.IsolatedAsyncioTestCase):
+    """Test the SSE stream behind /api/jobs/{id}/stream."""
+
+    def setUp(self):
+        self._saved_jobs = dashboard.JOBS.copy()
+        dashboard.JOBS.clear()
+
+    def tearDown(self):
+        dashboard.JOBS.clear()
+        dashboard.JOBS.update(self._saved_jobs)
+        dashboard._JOB_WAITERS.clear()
+
+    @staticmethod
+    def _payload(message):
+        prefix, _, body = message.partition(b" ")
+        assert prefix == b"data:" and body.endswith(b"\n\n"), message
+        return orjson.loads(body)
+
+    async def test_stream_emits_final_state_and_closes(self):
+        """A running job yields its state now, then its final state, then ends."""
+        job = _job("streamed", "running")
+        dashboard._put_job(job)
+        events = dashboard._job_events(job.id)
+
+        first = await events.__anext__()
+        self.assertEqual(self._payload(first)["status"], "running")
+
+        # What _run_job does when the runner returns
+        job.status, job.result, job.finished_at = "done", "final", time.time()
+        dashboard._notify_job_finished(job.id)
+
+        last = await asyncio.wait_for(events.__anext__(), 1.0)
+        self.assertEqual(self._payload(last)["status"], "done")
+        self.assertEqual(self._payload(last)["result"], "final")
+        with self.assertRaises(StopAsyncIteration):
+            await events.__anext__()
+        self.assertNotIn(job.id, dashboard._JOB_WAITERS)
+
+    async def test_stream_of_finished_job_closes_after_one_event(self):
+        """A job that already finished yields its state once."""
+        dashboard._put_job(_job("finished", "error", time.time()))
+        messages = [message async for message in dashboard._job_events("finished")]
+
+        self.assertEqual(len(messages), 1)
+        self.assertEqual(self._payload(messages[0])["status"], "error")
+
+    async def test_stream_of_unknown_job_is_empty(self):
+        """Unknown job ids produce no events."""
+        messages = [message async for message in dashboard._job_events("missing")]
+        self.assertEqual(messages, [])
+
+
+@unittest.skipUnless(_HAS_DASHBOARD_DEPS, "dashboard dependencies not installed")
+class TestExperimentRequest(unittest.TestCase):
+    """Test validation of POST /api/experiment bodies."""
+
+    def _error(self, body):
+        with self.assertRaises(dashboard.ValidationError) as caught:
+            dashboard.ExperimentRequest.model_validate_json(body)
+        return dashboard._experiment_error(caught.exception)
+
+    def test_valid_body(self):
+        """Valid bodies keep their values; omitted fields take the defaults."""
+        req = dashboard.ExperimentRequest.model_validate_json(b'{"prompt": "h", "probe_count": 10}')
+        self.assertEqual(req.probe_count, 10)
+        self.assertEqual(req.protocol, "underspecification_stress")
+        self.assertTrue(req.include_control)
+
+    def test_probe_count_out_of_range(self):
+        """Integers outside 1..10 get the range message."""
+        for count in (b"0", b"11", b"-3"):
+            with self.subTest(count=count):
+                self.assertEqual(self._error(b'{"probe_count": ' + count + b'}'),
+                                 "Probe count must be between 1 and 10")
+
+    def test_probe_count_wrong_type(self):
+        """Non-integers, including "3" and 3.0, get the type message."""
+        for count in (b'"abc"', b'"3"', b"2.5", b"3.0", b"null", b"true"):
+            with self.subTest(count=count):
+                self.assertEqual(self._error(b'{"probe_count": ' + count + b'}'),
+                                 "Probe count must be an integer")
+
+    def test_invalid_protocol(self):
+        """Unknown protocols list the accepted ones."""
+        self.assertTrue(self._error(b'{"protocol": "nope"}').startswith("Invalid protocol."))
+
+
+@unittest.skipUnless(_HAS_DASHBOARD_DEPS, "dashboard dependencies not installed")
+class TestPickEncoding(unittest.TestCase):
+    """Test Accept-Encoding negotiation for the precompressed assets."""
+
+    BOTH = {"br": b"", "gzip": b""}
+    GZIP_ONLY = {"gzip": b""}
+
+    def test_prefers_brotli(self):
+        """br wins over gzip when both are offered and available."""
+        self.assertEqual(dashboard._pick_encoding("gzip, deflate, br", self.BOTH), "br")
+        self.assertEqual(dashboard._pick_encoding("gzip, br", self.GZIP_ONLY), "gzip")
+
+    def test_q_zero_refuses_a_coding(self):
+        """q=0 in any spelling refuses a coding; any positive q accepts it."""
+        self.assertEqual(dashboard._pick_encoding("br;q=0, gzip", self.BOTH), "gzip")
+        self.assertIsNone(dashboard._pick_encoding("gzip;q=0.000", self.BOTH))
+        self.assertIsNone(dashboard._pick_encoding("br, gzip;q=0.000", self.GZIP_ONLY))
+        self.assertEqual(dashboard._pick_encoding("gzip;q=0.001", self.GZIP_ONLY), "gzip")
+
+    def test_wildcard(self):
+        """* accepts every coding the header does not name."""
+        self.assertEqual(dashboard._pick_encoding("*", self.BOTH), "br")
+        self.assertEqual(dashboard._pick_encoding("br;q=0, *", self.BOTH), "gzip")
+        self.assertEqual(dashboard._pick_encoding("*;q=0, gzip", self.BOTH), "gzip")
+        self.assertIsNone(dashboard._pick_encoding("*;q=0", self.BOTH))
+
+    def test_empty_or_malformed_header_means_identity(self):
+        """No usable coding falls back to the uncompressed body."""
+        self.assertIsNone(dashboard._pick_encoding("", self.BOTH))
+        self.assertIsNone(dashboard._pick_encoding(" , ", self.BOTH))
+        self.assertIsNone(dashboard._pick_encoding("identity", self.BOTH))
+        self.assertIsNone(dashboard._pick_encoding("gzip;q=abc", self.BOTH))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,57 @@
+"""
+Unit tests for research trace storage.
+
+Tests that traces round-trip through encode_trace/decode_trace, including
+data orjson cannot represent and traces written by the old json writer.
+"""
+
+import importlib.util
+import json
+import math
+import unittest
+import sys
+from pathlib import Path
+
+# Add parent directory to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+_HAS_SESSION_DEPS = all(importlib.util.find_spec(name) for name in ("orjson", "requests"))
+if _HAS_SESSION_DEPS:
+    from core.research.research_session import decode_trace, encode_trace
+
+
+@unittest.skipUnless(_HAS_SESSION_DEPS, "orjson/requests not installed")
+class TestTraceEncoding(unittest.TestCase):
+    """Test the trace JSON writer and reader."""
+
+    def test_round_trip_is_compact(self):
+        """Plain traces are written without whitespace and read back unchanged."""
+        trace = {"prompt": "p", "result": "résumé", "steps": [{"action": "a", "count": 2}]}
+        raw = encode_trace(trace)
+        self.assertNotIn(b" ", raw)
+        self.assertEqual(decode_trace(raw), trace)
+
+    def test_big_ints_and_non_finite_floats_survive(self):
+        """Values orjson rejects or nulls are written the way json writes them."""
+        trace = {"big": 2 ** 70, "nan": float("nan"), "inf": float("inf"), "none": None}
+        decoded = decode_trace(encode_trace(trace))
+        self.assertEqual(decoded["big"], 2 ** 70)
+        self.assertTrue(math.isnan(decoded["nan"]))
+        self.assertEqual(decoded["inf"], float("inf"))
+        self.assertIsNone(decoded["none"])
+
+    def test_reads_legacy_json_traces(self):
+        """Indented json.dump output, NaN included, still loads."""
+        legacy = {"prompt": "p", "stats": {"mean": float("nan")}, "steps": []}
+        decoded = decode_trace(json.dumps(legacy, indent=2).encode("utf-8"))
+        self.assertEqual(decoded["prompt"], "p")
+        self.assertTrue(math.isnan(decoded["stats"]["mean"]))
+
+    def test_invalid_json_still_raises(self):
+        """Corrupt files raise a JSONDecodeError either way."""
+        with self.assertRaises(json.JSONDecodeError):
+            decode_trace(b'{"prompt": ')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -4,6 +4,7 @@ Unit tests for SAP scoring system.
 Tests the deterministic heuristic scoring of Structured Action Proposals.
 """
 
+import importlib.util
 import unittest
 import sys
 from pathlib import Path
@@ -13,26 +14,58 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from core.router.sap_scoring.score_sap import (
     score_sap,
+    score_saps,
     _calculate_plausibility,
     _calculate_utility,
     _calculate_novelty,
     _calculate_risk,
     _calculate_alignment,
     _calculate_efficiency,
-    _calculate_resilience
+    _calculate_resilience,
+    _raw_degrees,
+    _tokenize
+)
+
+
+_EXPECTED_KEYS = (
+    "plausibility", "utility", "novelty", "risk",
+    "alignment", "efficiency", "resilience"
 )
 
 
 class TestSAPScoring(unittest.TestCase):
     """Test SAP scoring functions."""
 
-    def test_score_sap_structure(self):
-        """Test that score_sap returns correct structure."""
-        sap = {
+    @classmethod
+    def setUpClass(cls):
+        """Score the fixed example SAPs once for the whole class."""
+        cls.basic_result = score_sap({
             "title": "Test Proposal",
             "description": "A test description"
-        }
-        result = score_sap(sap)
+        })
+        # High-risk proposal
+        cls.risky_result = score_sap({
+            "title": "Experimental Approach",
+            "description": "Untested radical breaking changes"
+        })
+        # Well-defined technical proposal
+        cls.caching_result = score_sap({
+            "title": "Implement Caching Layer",
+            "description": "Deploy Redis cache to improve API performance and reduce database load"
+        })
+        # Experimental proposal
+        cls.latent_result = score_sap({
+            "title": "Experimental Latent Approach",
+            "description": "Innovative experimental neural traversal with novel architecture"
+        })
+        cls.short_result = score_sap({
+            "title": "Test",
+            "description": "Test description"
+        })
+
+    def test_score_sap_structure(self):
+        """Test that score_sap returns correct structure."""
+        result = self.basic_result
 
         # Check structure
         self.assertIn("title", result)
@@ -40,17 +73,13 @@ class TestSAPScoring(unittest.TestCase):
         self.assertIn("degrees", result)
         self.assertIn("composite_score", result)
 
-        # Check degrees
+        # Check degrees: every expected key present, each an int in 0-10
         degrees = result["degrees"]
-        expected_keys = [
-            "plausibility", "utility", "novelty", "risk",
-            "alignment", "efficiency", "resilience"
-        ]
-        for key in expected_keys:
-            self.assertIn(key, degrees)
-            self.assertIsInstance(degrees[key], int)
-            self.assertGreaterEqual(degrees[key], 0)
-            self.assertLessEqual(degrees[key], 10)
+        self.assertLessEqual(set(_EXPECTED_KEYS), degrees.keys())
+        self.assertTrue(
+            all(isinstance(degrees[k], int) and 0 <= degrees[k] <= 10 for k in _EXPECTED_KEYS),
+            degrees
+        )
 
         # Check composite score
         self.assertEqual(result["composite_score"], sum(degrees.values()))
@@ -133,14 +162,24 @@ class TestSAPScoring(unittest.TestCase):
 
         self.assertGreater(high, low)
 
+    def test_raw_degrees(self):
+        """The generated scorer applies every rule in _DIMENSION_RULES."""
+        cases = [
+            ("implement api endpoint with test coverage", (10, 5, 5, 5, 5, 5, 6)),
+            ("maybe we could potentially try something", (3, 5, 5, 5, 5, 5, 5)),
+            ("robust fault-tolerant with error handling", (5, 5, 5, 5, 5, 5, 10)),
+            ("bypass security checks and skip validation", (5, 5, 5, 5, 0, 5, 6)),
+            ("untested radical breaking changes. stable, tested, proven!", (5, 5, 5, 8, 5, 5, 5)),
+            ("", (5, 5, 5, 5, 5, 5, 5)),
+        ]
+        for text, expected in cases:
+            with self.subTest(text=text):
+                self.assertEqual(_raw_degrees(_tokenize(text), text), expected)
+
     def test_risk_inversion(self):
         """Test that risk is properly inverted in final scoring."""
         # High-risk proposal should have LOW risk score after inversion
-        risky_sap = {
-            "title": "Experimental Approach",
-            "description": "Untested radical breaking changes"
-        }
-        result = score_sap(risky_sap)
+        result = self.risky_result
 
         # The risk degree should be inverted (10 - raw_risk)
         # So high-risk proposals get lower risk scores
@@ -148,11 +187,7 @@ class TestSAPScoring(unittest.TestCase):
 
     def test_real_world_example_1(self):
         """Test scoring of a well-defined technical proposal."""
-        sap = {
-            "title": "Implement Caching Layer",
-            "description": "Deploy Redis cache to improve API performance and reduce database load"
-        }
-        result = score_sap(sap)
+        result = self.caching_result
 
         # Should score high on plausibility, utility, efficiency
         self.assertGreater(result["degrees"]["plausibility"], 5)
@@ -161,11 +196,7 @@ class TestSAPScoring(unittest.TestCase):
 
     def test_real_world_example_2(self):
         """Test scoring of an experimental proposal."""
-        sap = {
-            "title": "Experimental Latent Approach",
-            "description": "Innovative experimental neural traversal with novel architecture"
-        }
-        result = score_sap(sap)
+        result = self.latent_result
 
         # Should score high on novelty, but higher risk
         self.assertGreater(result["degrees"]["novelty"], 5)
@@ -174,11 +205,7 @@ class TestSAPScoring(unittest.TestCase):
 
     def test_composite_score_range(self):
         """Test that composite score is in valid range."""
-        sap = {
-            "title": "Test",
-            "description": "Test description"
-        }
-        result = score_sap(sap)
+        result = self.short_result
 
         # With 7 dimensions, each 0-10, total should be 0-70
         self.assertGreaterEqual(result["composite_score"], 0)
@@ -228,5 +255,65 @@ class TestSAPScoringComparison(unittest.TestCase):
         )
 
 
+class TestSAPScoringDimensions(unittest.TestCase):
+    """Test that each example SAP scores high on the dimension it targets."""
+
+    # (sap, dimension expected above the baseline of 5)
+    CASES = [
+        ({"title": "Deploy Monitoring",
+          "description": "Implement Prometheus metrics and Grafana dashboards for system monitoring"},
+         "plausibility"),
+        ({"title": "Implement Caching Layer",
+          "description": "Deploy Redis cache to improve API performance and reduce database load"},
+         "utility"),
+        ({"title": "Implement Caching Layer",
+          "description": "Deploy Redis cache to improve API performance and reduce database load"},
+         "efficiency"),
+        ({"title": "Experimental Latent Approach",
+          "description": "Innovative experimental neural traversal with novel architecture"},
+         "novelty"),
+        ({"title": "Tested Approach",
+          "description": "Deploy proven validated solution with comprehensive testing"},
+         "risk"),
+        ({"title": "Harden Auth",
+          "description": "Secure validated login flow with privacy review and audit logging"},
+         "alignment"),
+        ({"title": "Resilient Ingest",
+          "description": "Robust fault-tolerant pipeline with fallback and error handling"},
+         "resilience"),
+    ]
+
+    def test_targeted_dimension_above_baseline(self):
+        """Each case scores above 5 on its target dimension."""
+        for sap, dim in self.CASES:
+            with self.subTest(title=sap["title"], dim=dim):
+                self.assertGreater(score_sap(sap)["degrees"][dim], 5)
+
+
+@unittest.skipUnless(importlib.util.find_spec("numpy"), "numpy not installed")
+class TestSAPBatchScoring(unittest.TestCase):
+    """Test that batch scoring matches scoring SAPs one at a time."""
+
+    def test_batch_matches_scalar(self):
+        """score_saps gives the same result as score_sap for each SAP."""
+        saps = [
+            {"title": "Implement Caching Layer",
+             "description": "Deploy Redis cache to improve API performance and reduce database load"},
+            {"title": "Experimental Latent Approach",
+             "description": "Innovative experimental neural traversal with novel architecture"},
+            {"title": "Maybe Improve Things",
+             "description": "Perhaps we could potentially try to make it better somehow"},
+            {"title": "Harden Ingest",
+             "description": "Robust fault-tolerant pipeline with rollback. " * 30},
+            {"title": "", "description": ""},
+        ]
+
+        self.assertEqual(score_saps(saps), [score_sap(sap) for sap in saps])
+
+    def test_empty_batch(self):
+        """An empty batch scores to an empty list."""
+        self.assertEqual(score_saps([]), [])
+
+
 if __name__ == "__main__":
     unittest.main()